@@ -714,16 +714,17 @@ def fetch_guidance(
             console.print(table)
             return
 
-        # Fetch and store each document
-        for i, doc in enumerate(all_docs):
+        # Fetch and store each document; PDFs download concurrently in batches
+        for i, (doc, pdf_content) in enumerate(fetcher.iter_pdfs(all_docs)):
             console.print(
                 f"[{i+1}/{len(all_docs)}] Fetching {doc.doc_type.value} {doc.doc_number}...",
                 end=" ",
             )
 
             try:
-                # Fetch PDF to get file size (we don't parse content yet)
-                pdf_content = fetcher.fetch_pdf(doc)
+                # Failed downloads come back as the error instead of content
+                if isinstance(pdf_content, Exception):
+                    raise pdf_content
                 pdf_size = len(pdf_content)
 
                 # Optionally save PDF
@@ -1444,31 +1445,31 @@ def download_uk(
         arch download-uk --all --resume           # Resume interrupted download
         arch download-uk --list-acts              # List all available acts
     """
-    import asyncio
     from datetime import datetime
 
     from arch.fetchers.legislation_uk import (
         UK_PRIORITY_ACTS,
+        UK_PRIORITY_CITATIONS,
         BulkDownloadProgress,
         UKActReference,
         UKLegislationFetcher,
+        run_uk,
     )
     from arch.models_uk import UKCitation
 
-    fetcher = UKLegislationFetcher(data_dir=output)
-
     # List all acts mode
     if list_acts:
         console.print("[blue]Enumerating all UK Public General Acts...[/blue]")
 
         async def list_all():
-            acts = await fetcher.list_all_ukpga_acts(
-                page_size=50,
-                progress_callback=lambda msg: console.print(f"[dim]{msg}[/dim]"),
-            )
-            return acts
+            async with UKLegislationFetcher(data_dir=output) as fetcher:
+                acts = await fetcher.list_all_ukpga_acts(
+                    page_size=50,
+                    progress_callback=lambda msg: console.print(f"[dim]{msg}[/dim]"),
+                )
+                return acts
 
-        acts = asyncio.run(list_all())
+        acts = run_uk(list_all())
 
         # Group by year
         by_year: dict[int, list] = {}
@@ -1496,47 +1497,35 @@ def download_uk(
         console.print("[blue]Downloading priority UK tax/benefits acts...[/blue]")
 
         async def download_priority():
-            total_sections = 0
-            for act_ref in UK_PRIORITY_ACTS:
-                try:
-                    parsed = UKCitation.from_string(act_ref)
-                    console.print(f"\n[cyan]Downloading {act_ref}...[/cyan]")
-
-                    if dry_run:
-                        console.print(f"  [yellow]DRY RUN - would download {act_ref}[/yellow]")
-                        continue
-
-                    act = await fetcher.fetch_act_metadata(parsed)
-                    console.print(f"  [green]{act.title}[/green]")
-
-                    # Download the full XML
-                    act_output = output / "ukpga" / str(parsed.year) / f"{parsed.number}.xml"
-                    act_output.parent.mkdir(parents=True, exist_ok=True)
-
-                    url = f"https://www.legislation.gov.uk/{act_ref}/data.xml"
-                    await fetcher._rate_limit()
-
-                    import httpx
-                    async with httpx.AsyncClient() as client:
-                        response = await client.get(
-                            url,
-                            headers={"User-Agent": "Arch/1.0"},
-                            follow_redirects=True,
-                            timeout=120,
-                        )
-                        response.raise_for_status()
-                        act_output.write_text(response.text)
+            async with UKLegislationFetcher(data_dir=output) as fetcher:
+                total_sections = 0
+                for act_ref, parsed in zip(UK_PRIORITY_ACTS, UK_PRIORITY_CITATIONS, strict=True):
+                    try:
+                        console.print(f"\n[cyan]Downloading {act_ref}...[/cyan]")
 
-                    section_count = response.text.count("<P1 ")
-                    total_sections += section_count
-                    console.print(f"  [dim]Saved {section_count} sections to {act_output}[/dim]")
+                        if dry_run:
+                            console.print(f"  [yellow]DRY RUN - would download {act_ref}[/yellow]")
+                            continue
 
-                except Exception as e:
-                    console.print(f"  [red]FAILED: {e}[/red]")
+                        act = await fetcher.fetch_act_metadata(parsed)
+                        console.print(f"  [green]{act.title}[/green]")
+
+                        # Save the full XML, already fetched and cached for the metadata
+                        xml_bytes = await fetcher.fetch_act_xml(parsed)
+                        act_output = output / "ukpga" / str(parsed.year) / f"{parsed.number}.xml"
+                        act_output.parent.mkdir(parents=True, exist_ok=True)
+                        act_output.write_bytes(xml_bytes)
+
+                        section_count = xml_bytes.count(b"<P1 ")
+                        total_sections += section_count
+                        console.print(f"  [dim]Saved {section_count} sections to {act_output}[/dim]")
+
+                    except Exception as e:
+                        console.print(f"  [red]FAILED: {e}[/red]")
 
-            return total_sections
+                return total_sections
 
-        total = asyncio.run(download_priority())
+        total = run_uk(download_priority())
         console.print(f"\n[green]Downloaded {len(UK_PRIORITY_ACTS)} priority acts ({total} total sections)[/green]")
         return
 
@@ -1567,24 +1556,25 @@ def download_uk(
             return
 
         async def bulk_download():
-            if dry_run:
-                # Just enumerate
-                acts = await fetcher.list_all_ukpga_acts(
-                    page_size=50,
-                    progress_callback=lambda msg: console.print(f"[dim]{msg}[/dim]"),
+            async with UKLegislationFetcher(data_dir=output) as fetcher:
+                if dry_run:
+                    # Just enumerate
+                    acts = await fetcher.list_all_ukpga_acts(
+                        page_size=50,
+                        progress_callback=lambda msg: console.print(f"[dim]{msg}[/dim]"),
+                    )
+                    console.print(f"\n[green]Found {len(acts)} acts (dry run - not downloading)[/green]")
+                    return None
+
+                result = await fetcher.bulk_download_ukpga(
+                    output_dir=output / "ukpga",
+                    progress=progress,
+                    progress_callback=lambda msg: console.print(msg),
+                    log_file=log_file,
                 )
-                console.print(f"\n[green]Found {len(acts)} acts (dry run - not downloading)[/green]")
-                return None
-
-            result = await fetcher.bulk_download_ukpga(
-                output_dir=output / "ukpga",
-                progress=progress,
-                progress_callback=lambda msg: console.print(msg),
-                log_file=log_file,
-            )
-            return result
+                return result
 
-        result = asyncio.run(bulk_download())
+        result = run_uk(bulk_download())
 
         if result:
             console.print(f"\n[bold green]Download complete![/bold green]")
@@ -1618,8 +1608,13 @@ def download_uk(
     if parsed.section:
         # Single section
         console.print(f"[blue]Fetching:[/blue] {parsed.legislation_url}")
+
+        async def fetch_one():
+            async with UKLegislationFetcher(data_dir=output) as fetcher:
+                return await fetcher.fetch_section(parsed)
+
         with console.status("Downloading..."):
-            section = asyncio.run(fetcher.fetch_section(parsed))
+            section = run_uk(fetch_one())
         console.print(f"[green]Downloaded:[/green] {section.title}")
         console.print(f"[dim]Text: {len(section.text)} chars[/dim]")
     else:
@@ -1627,30 +1622,31 @@ def download_uk(
         console.print(f"[blue]Fetching Act:[/blue] {parsed.legislation_url}")
 
         async def fetch_all():
-            act = await fetcher.fetch_act_metadata(parsed)
-            console.print(f"[green]Act:[/green] {act.title}")
-            console.print(f"[dim]Sections: {act.section_count or 'unknown'}[/dim]")
+            async with UKLegislationFetcher(data_dir=output) as fetcher:
+                act = await fetcher.fetch_act_metadata(parsed)
+                console.print(f"[green]Act:[/green] {act.title}")
+                console.print(f"[dim]Sections: {act.section_count or 'unknown'}[/dim]")
 
-            max_sections = sections or act.section_count or 100
-            count = 0
-            with console.status(f"Downloading sections (max {max_sections})..."):
-                for i in range(1, max_sections + 1):
-                    try:
-                        section_cite = UKCitation(
-                            type=parsed.type,
-                            year=parsed.year,
-                            number=parsed.number,
-                            section=str(i),
-                        )
-                        await fetcher.fetch_section(section_cite)
-                        count += 1
-                        if count % 50 == 0:
-                            console.print(f"  [dim]Downloaded {count} sections...[/dim]")
-                    except Exception:
-                        continue
-            return count
-
-        count = asyncio.run(fetch_all())
+                max_sections = sections or act.section_count or 100
+                count = 0
+                with console.status(f"Downloading sections (max {max_sections})..."):
+                    for i in range(1, max_sections + 1):
+                        try:
+                            section_cite = UKCitation(
+                                type=parsed.type,
+                                year=parsed.year,
+                                number=parsed.number,
+                                section=str(i),
+                            )
+                            await fetcher.fetch_section(section_cite)
+                            count += 1
+                            if count % 50 == 0:
+                                console.print(f"  [dim]Downloaded {count} sections...[/dim]")
+                        except Exception:
+                            continue
+                return count
+
+        count = run_uk(fetch_all())
         console.print(f"[green]Downloaded {count} sections[/green]")
 
 
@@ -1826,9 +1822,7 @@ def get_uk(citation: str, as_json: bool):
         arch get-uk "ITEPA 2003 s.62"
         arch get-uk "ukpga/2007/3/section/1" --json
     """
-    import asyncio
-
-    from arch.fetchers.legislation_uk import UKLegislationFetcher
+    from arch.fetchers.legislation_uk import UKLegislationFetcher, run_uk
     from arch.models_uk import UKCitation
 
     try:
@@ -1842,10 +1836,12 @@ def get_uk(citation: str, as_json: bool):
         console.print("[dim]Use format: ukpga/2003/1/section/62[/dim]")
         raise SystemExit(1)
 
-    fetcher = UKLegislationFetcher()
+    async def fetch_one():
+        async with UKLegislationFetcher() as fetcher:
+            return await fetcher.fetch_section(parsed)
 
     with console.status("Fetching..."):
-        section = asyncio.run(fetcher.fetch_section(parsed))
+        section = run_uk(fetch_one())
 
     if as_json:
         console.print_json(section.model_dump_json())
@@ -29,7 +29,7 @@ import httpx
 import click
 from bs4 import BeautifulSoup
 
-from arch.sources.registry import get_all_configs, SourceConfig
+from arch.sources.registry import get_all_configs, get_config_for_jurisdiction, SourceConfig
 from arch.sources.specs import load_spec, load_all_specs, get_section_pattern
 
 
@@ -186,12 +186,10 @@ async def crawl_jurisdiction(
     Returns:
         Dict with crawl statistics
     """
-    configs = get_all_configs()
-    if jurisdiction not in configs:
+    config = get_config_for_jurisdiction(jurisdiction)
+    if config is None:
         raise ValueError(f"Unknown jurisdiction: {jurisdiction}")
 
-    config = configs[jurisdiction]
-
     # Create crawler
     crawler = StateCrawler(config, concurrency, dry_run, delay)
 
@@ -700,11 +698,9 @@ async def crawl_state(
     delay: float = 0.1,
 ) -> CrawlStats:
     """Crawl a single state."""
-    configs = get_all_configs()
-    if jurisdiction not in configs:
+    config = get_config_for_jurisdiction(jurisdiction)
+    if config is None:
         raise ValueError(f"Unknown jurisdiction: {jurisdiction}")
-
-    config = configs[jurisdiction]
     crawler = StateCrawler(config, max_concurrent, dry_run, delay)
     return await crawler.crawl(max_sections)
 
@@ -13,14 +13,15 @@ The IRS publishes guidance documents in two locations:
 2. https://www.irs.gov/irb - Internal Revenue Bulletin HTML pages
 """
 
+import asyncio
 import re
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Optional
 
 import httpx
-from bs4 import BeautifulSoup
 
 from arch.models_guidance import GuidanceSection, GuidanceType, RevenueProcedure
 
@@ -42,13 +43,7 @@ class IRSDropDocument:
     @property
     def id(self) -> str:
         """Generate document ID for database storage."""
-        prefix = {
-            GuidanceType.REV_PROC: "rp",
-            GuidanceType.REV_RUL: "rr",
-            GuidanceType.NOTICE: "notice",
-            GuidanceType.ANNOUNCEMENT: "announce",
-        }[self.doc_type]
-        return f"{prefix}-{self.doc_number}"
+        return f"{TYPE_TO_ID_PREFIX[self.doc_type]}-{self.doc_number}"
 
 
 # Mapping from filename prefix to GuidanceType
@@ -59,15 +54,38 @@ PREFIX_TO_TYPE = {
     "a": GuidanceType.ANNOUNCEMENT,
 }
 
+# Mapping from GuidanceType to database ID prefix
+TYPE_TO_ID_PREFIX = {
+    GuidanceType.REV_PROC: "rp",
+    GuidanceType.REV_RUL: "rr",
+    GuidanceType.NOTICE: "notice",
+    GuidanceType.ANNOUNCEMENT: "announce",
+}
+
+# Mapping from GuidanceType to the name used in document titles
+TYPE_TO_TITLE = {
+    GuidanceType.REV_PROC: "Revenue Procedure",
+    GuidanceType.REV_RUL: "Revenue Ruling",
+    GuidanceType.NOTICE: "Notice",
+    GuidanceType.ANNOUNCEMENT: "Announcement",
+}
+
 # Pattern to match guidance document filenames: rp-24-40.pdf, rr-23-12.pdf, n-22-45.pdf
 # Can appear as just filename or in full URL path
 GUIDANCE_PATTERN = re.compile(r"(rp|rr|n|a)-(\d{2})-(\d+)\.pdf", re.IGNORECASE)
 
+# The same filenames, but only inside an href attribute value, so listings can
+# be scanned without building a DOM
+GUIDANCE_HREF_PATTERN = re.compile(
+    r"""href\s*=\s*["']?[^"'\s>]*?(rp|rr|n|a)-(\d{2})-(\d+)\.pdf""", re.IGNORECASE
+)
+
 
 def parse_irs_drop_listing(
     html: str,
     year: int | None = None,
     doc_types: list[GuidanceType] | None = None,
+    years: Iterable[int] | None = None,
 ) -> list[IRSDropDocument]:
     """Parse IRS drop folder HTML listing to extract document metadata.
 
@@ -75,36 +93,34 @@ def parse_irs_drop_listing(
         html: HTML content of the drop folder listing
         year: Optional filter by year (4-digit, e.g., 2024)
         doc_types: Optional filter by document types
+        years: Optional filter by several years, in one pass over the listing
 
     Returns:
         List of IRSDropDocument objects
     """
-    soup = BeautifulSoup(html, "html.parser")
+    year_set = frozenset(years) if years is not None else None
+    type_set = frozenset(doc_types) if doc_types is not None else None
     documents = []
     seen = set()  # Track seen filenames to avoid duplicates
 
-    for link in soup.find_all("a", href=True):
-        href = link["href"]
-
-        # Search for guidance pattern anywhere in the URL
-        match = GUIDANCE_PATTERN.search(href)
-        if not match:
-            continue
-
+    # Guidance filenames can appear anywhere in a link's URL
+    for match in GUIDANCE_HREF_PATTERN.finditer(html):
         prefix, year_short, num = match.groups()
         prefix = prefix.lower()
 
         # Convert 2-digit year to 4-digit
         year_4digit = 2000 + int(year_short)
 
-        # Apply year filter
+        # Apply year filters
         if year is not None and year_4digit != year:
             continue
+        if year_set is not None and year_4digit not in year_set:
+            continue
 
         doc_type = PREFIX_TO_TYPE[prefix]
 
         # Apply type filter
-        if doc_types is not None and doc_type not in doc_types:
+        if type_set is not None and doc_type not in type_set:
             continue
 
         doc_number = f"{year_4digit}-{num}"
@@ -127,6 +143,15 @@ def parse_irs_drop_listing(
     return documents
 
 
+def _documents_for_years(
+    html: str, years: list[int], doc_types: list[GuidanceType] | None
+) -> list[IRSDropDocument]:
+    """Documents for several years from one listing pass, grouped by year in order."""
+    order = {y: i for i, y in enumerate(dict.fromkeys(years))}
+    docs = parse_irs_drop_listing(html, doc_types=doc_types, years=years)
+    return sorted(docs, key=lambda d: order[d.year])
+
+
 class IRSBulkFetcher:
     """Bulk fetch IRS guidance documents from official sources."""
 
@@ -210,6 +235,105 @@ class IRSBulkFetcher:
         response.raise_for_status()
         return response.content
 
+    async def fetch_many(
+        self,
+        docs: list[IRSDropDocument],
+        concurrency: int = 8,
+    ) -> list[bytes | httpx.HTTPError]:
+        """Fetch PDF content for many documents concurrently.
+
+        Requests share one HTTP/2 client, with at most ``concurrency`` in
+        flight at once.
+
+        Args:
+            docs: Documents to fetch
+            concurrency: Maximum simultaneous downloads
+
+        Returns:
+            PDF content for each document, in input order. A document whose
+            download failed gets its httpx.HTTPError instead, so one bad file
+            doesn't abort the batch.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with httpx.AsyncClient(
+            timeout=self.client.timeout,
+            follow_redirects=True,
+            headers=self.client.headers,
+            http2=True,
+        ) as client:
+
+            async def fetch(doc: IRSDropDocument) -> bytes | httpx.HTTPError:
+                async with semaphore:
+                    try:
+                        response = await client.get(doc.pdf_url)
+                        response.raise_for_status()
+                        return response.content
+                    except httpx.HTTPError as e:
+                        return e
+
+            return await asyncio.gather(*(fetch(doc) for doc in docs))
+
+    def fetch_pdfs(
+        self,
+        docs: list[IRSDropDocument],
+        concurrency: int = 8,
+    ) -> list[bytes | httpx.HTTPError]:
+        """Synchronous wrapper around ``fetch_many``."""
+        return asyncio.run(self.fetch_many(docs, concurrency))
+
+    def iter_pdfs(
+        self,
+        docs: list[IRSDropDocument],
+        concurrency: int = 8,
+        batch_size: int = 64,
+    ) -> Iterator[tuple[IRSDropDocument, bytes | httpx.HTTPError]]:
+        """Fetch PDFs concurrently, yielding each document with its result.
+
+        Documents are fetched ``batch_size`` at a time through ``fetch_pdfs``
+        so only one batch of PDFs is held in memory.
+
+        Args:
+            docs: Documents to fetch
+            concurrency: Maximum simultaneous downloads
+            batch_size: Documents fetched per batch
+
+        Yields:
+            ``(doc, content)`` pairs in input order, where ``content`` is the
+            document's httpx.HTTPError if its download failed
+        """
+        for start in range(0, len(docs), batch_size):
+            batch = docs[start : start + batch_size]
+            yield from zip(batch, self.fetch_pdfs(batch, concurrency), strict=True)
+
+    def fetch_pdf_to(self, doc: IRSDropDocument, path: Path) -> int:
+        """Stream a document's PDF straight to a file.
+
+        The body is written in chunks rather than held in memory, to a
+        temporary file that is renamed into place once complete, so an
+        interrupted download never leaves a truncated PDF behind.
+
+        Args:
+            doc: Document metadata
+            path: Destination file
+
+        Returns:
+            Number of bytes written
+        """
+        tmp_path = path.with_name(path.name + ".part")
+        size = 0
+        try:
+            with self.client.stream("GET", doc.pdf_url) as response:
+                response.raise_for_status()
+                with open(tmp_path, "wb") as f:
+                    for chunk in response.iter_bytes(64 * 1024):
+                        f.write(chunk)
+                        size += len(chunk)
+            tmp_path.replace(path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return size
+
     def fetch_and_extract(
         self,
         doc: IRSDropDocument,
@@ -322,21 +446,19 @@ class IRSBulkFetcher:
 
         # Get full document listing
         html = self._fetch_drop_listing()
-        all_docs = []
-        for year in years:
-            docs = parse_irs_drop_listing(html, year=year, doc_types=doc_types)
-            all_docs.extend(docs)
+        all_docs = _documents_for_years(html, years, doc_types)
 
         if progress_callback:
             progress_callback(f"Found {len(all_docs)} documents for years {years}")
 
         results = []
-        for i, doc in enumerate(all_docs):
+        for i, (doc, pdf_content) in enumerate(self.iter_pdfs(all_docs)):
             if progress_callback:
                 progress_callback(f"[{i+1}/{len(all_docs)}] Fetching {doc.doc_number} ({doc.doc_type.value})")
 
             try:
-                pdf_content = self.fetch_pdf(doc)
+                if isinstance(pdf_content, httpx.HTTPError):
+                    raise pdf_content
 
                 # Optionally save PDF
                 pdf_path = None
@@ -376,13 +498,7 @@ class IRSBulkFetcher:
 
     def _generate_title(self, doc: IRSDropDocument) -> str:
         """Generate a placeholder title for a document."""
-        type_names = {
-            GuidanceType.REV_PROC: "Revenue Procedure",
-            GuidanceType.REV_RUL: "Revenue Ruling",
-            GuidanceType.NOTICE: "Notice",
-            GuidanceType.ANNOUNCEMENT: "Announcement",
-        }
-        return f"{type_names[doc.doc_type]} {doc.doc_number}"
+        return f"{TYPE_TO_TITLE[doc.doc_type]} {doc.doc_number}"
 
     def download_bulk_with_extraction(
         self,
@@ -459,10 +575,7 @@ class IRSBulkFetcher:
 
         html = self._fetch_drop_listing(progress_callback=progress_callback)
 
-        all_docs = []
-        for year in years:
-            docs = parse_irs_drop_listing(html, year=year, doc_types=doc_types)
-            all_docs.extend(docs)
+        all_docs = _documents_for_years(html, years, doc_types)
 
         stats["total_found"] = len(all_docs)
 
@@ -495,9 +608,13 @@ class IRSBulkFetcher:
                 if i > 0:
                     time.sleep(rate_limit_seconds)
 
-                # Download PDF
-                pdf_content = self.fetch_pdf(doc)
-                pdf_path.write_bytes(pdf_content)
+                # Download PDF, streaming it to disk unless its text is needed
+                if extract_text:
+                    pdf_content = self.fetch_pdf(doc)
+                    pdf_path.write_bytes(pdf_content)
+                    pdf_size = len(pdf_content)
+                else:
+                    pdf_size = self.fetch_pdf_to(doc, pdf_path)
 
                 # Extract text if requested
                 full_text = ""
@@ -539,7 +656,7 @@ class IRSBulkFetcher:
                 stats["by_year"][doc.year] = stats["by_year"].get(doc.year, 0) + 1
 
                 if progress_callback:
-                    size_kb = len(pdf_content) / 1024
+                    size_kb = pdf_size / 1024
                     params_info = f", {len(parameters)} param groups" if parameters else ""
                     progress_callback(f"  Downloaded: {size_kb:.1f} KB{params_info}")
 
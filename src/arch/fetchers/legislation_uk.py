@@ -7,22 +7,56 @@ Rate Limit: 3,000 requests per 5 minutes per IP (we use 5 req/sec to be safe)
 """
 
 import asyncio
+import functools
 import json
 import logging
+import random
 import re
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Coroutine
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import AsyncIterator, Callable, Iterator, Optional
+from typing import Any, NamedTuple, Optional, TypeVar
 from xml.etree import ElementTree as ET
 
 import httpx
 
+# Optional Rust-backed drop-in replacement for the httpx client - faster under
+# concurrency. Only the client comes from it; callers always see httpx errors.
+try:
+    import httpxr as _http
+except ImportError:
+    _http = httpx
+
+# Optional libuv-based event loop - cheaper per-coroutine dispatch
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from arch.fileio import atomic_write_bytes
 from arch.models_uk import UKAct, UKCitation, UKSection
-from arch.parsers.clml import parse_act_metadata, parse_section
+from arch.parsers.clml import (
+    parse_act_metadata,
+    parse_act_sections,
+    parse_contents_sections,
+    parse_section,
+)
 
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Above this many sections, one whole-Act download beats per-section requests
+WHOLE_ACT_THRESHOLD = 20
+
+# Transient statuses retried with exponential backoff, up to MAX_ATTEMPTS
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+MAX_ATTEMPTS = 4
+MAX_BACKOFF = 30.0
+
 
 # Priority Acts for PolicyEngine UK
 UK_PRIORITY_ACTS = [
@@ -38,6 +72,14 @@ UK_PRIORITY_ACTS = [
     "ukpga/2017/32",  # Finance Act 2017
 ]
 
+# Parsed once at import so bulk callers skip citation parsing
+UK_PRIORITY_CITATIONS: tuple[UKCitation, ...] = tuple(
+    UKCitation.from_string(act_ref) for act_ref in UK_PRIORITY_ACTS
+)
+
+
+USER_AGENT = "Arch/1.0 (https://github.com/CosilicoAI/arch)"
+
 
 # Atom feed namespaces
 ATOM_NS = {
@@ -46,6 +88,158 @@ ATOM_NS = {
 }
 
 
+class TokenBucket:
+    """Async token-bucket rate limiter.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    The lock only guards the bookkeeping; waiters sleep outside it so
+    concurrent callers are released as soon as tokens become available.
+    """
+
+    __slots__ = ("rate", "capacity", "_tokens", "_last", "_lock")
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        loop = asyncio.get_running_loop()
+        while True:
+            async with self._lock:
+                now = loop.time()
+                if self._last is not None:
+                    self._tokens = min(
+                        self.capacity, self._tokens + (now - self._last) * self.rate
+                    )
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            await asyncio.sleep(wait)
+
+
+@functools.lru_cache(maxsize=1024)
+def _act_prefix(base_url: str, leg_type: str, year: int, number: int) -> str:
+    """URL prefix shared by every document of an Act."""
+    return f"{base_url}/{leg_type}/{year}/{number}"
+
+
+def _consume_exception(task: asyncio.Future) -> None:
+    """Mark a shared task's exception as retrieved; its waiters still see it."""
+    if not task.cancelled():
+        task.exception()
+
+
+class SharedTask:
+    """A task awaited by several callers, cancelled once all of them give up.
+
+    Each caller awaits through ``asyncio.shield``, so one caller being
+    cancelled doesn't cancel the work for the others. When the last waiter
+    leaves before the task finishes, the task is cancelled and marked
+    ``abandoned`` so new callers start a fresh one instead of joining it.
+    """
+
+    __slots__ = ("task", "waiters", "abandoned")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+        self.abandoned = False
+
+    async def wait(self) -> Any:
+        """Await the shared result."""
+        self.waiters += 1
+        try:
+            return await asyncio.shield(self.task)
+        finally:
+            self.waiters -= 1
+            if not self.waiters and not self.task.done():
+                self.abandoned = True
+                self.task.cancel()
+
+
+def _as_httpx_error(exc: Exception) -> httpx.RequestError:
+    """Convert an httpxr request error to the httpx exception of the same name."""
+    exc_type = getattr(httpx, type(exc).__name__, None)
+    if not (isinstance(exc_type, type) and issubclass(exc_type, httpx.RequestError)):
+        exc_type = httpx.TransportError
+    return exc_type(str(exc))
+
+
+def _raise_for_status(response: Any, url: str) -> None:
+    """Raise ``httpx.HTTPStatusError`` for an unsuccessful response from either client."""
+    if isinstance(response, httpx.Response):
+        response.raise_for_status()
+    elif not 200 <= response.status_code < 300:
+        httpx.Response(
+            response.status_code,
+            headers=list(response.headers.items()),
+            request=httpx.Request("GET", url),
+        ).raise_for_status()
+
+
+def _retry_delay(attempt: int, retry_after: str | None) -> float:
+    """Backoff before retry ``attempt``, at least any Retry-After seconds."""
+    delay = min(2**attempt, MAX_BACKOFF) + random.random()
+    if retry_after and retry_after.isdigit():
+        delay = max(delay, float(retry_after))
+    return delay
+
+
+class FetchResult(NamedTuple):
+    """Status and raw body of an XML fetch."""
+
+    status: int
+    content: bytes
+
+
+@dataclass
+class CacheEntry:
+    """A cached XML document and the HTTP validators it was served with.
+
+    Validators are kept in a sidecar file next to the XML so a later
+    conditional GET can be answered with ``304 Not Modified``.
+    """
+
+    path: Path
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def meta_path(self) -> Path:
+        """Sidecar file holding the validators."""
+        return self.path.with_suffix(".etag")
+
+    @classmethod
+    def load(cls, path: Path) -> "CacheEntry":
+        """Load the validators stored for a cached document, if any."""
+        try:
+            data = json.loads(cls(path).meta_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(path)
+        return cls(path, etag=data.get("etag"), last_modified=data.get("last_modified"))
+
+    def save(self) -> None:
+        """Write the validators to the sidecar file."""
+        if self.etag or self.last_modified:
+            data = {"etag": self.etag, "last_modified": self.last_modified}
+            atomic_write_bytes(self.meta_path, json.dumps(data).encode("utf-8"))
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Request headers for a conditional GET against this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
 class UKActReference:
     """Reference to a UK Act from the legislation.gov.uk feed."""
 
@@ -147,6 +341,10 @@ class UKLegislationFetcher:
     """Fetcher for UK legislation from legislation.gov.uk.
 
     Downloads legislation XML and parses into UKSection/UKAct objects.
+
+    A single HTTP/2 client is kept open for the lifetime of the fetcher so
+    concurrent requests are multiplexed over a few reused connections. Use
+    as an async context manager (or call ``aclose()``) to release it.
     """
 
     def __init__(
@@ -154,6 +352,8 @@ class UKLegislationFetcher:
         data_dir: Optional[Path] = None,
         base_url: str = "https://www.legislation.gov.uk",
         rate_limit_delay: float = 0.2,
+        max_concurrency: int = 8,
+        section_cache_size: int = 1024,
     ):
         """Initialize the fetcher.
 
@@ -162,11 +362,72 @@ class UKLegislationFetcher:
                      Defaults to ~/.arch/uk/
             base_url: Base URL for legislation.gov.uk API.
             rate_limit_delay: Seconds between requests (default 0.2 = 5/sec).
+            max_concurrency: Maximum section fetches in flight at once.
+            section_cache_size: Parsed sections kept in memory (LRU).
         """
         self.base_url = base_url
         self.data_dir = data_dir or Path.home() / ".arch" / "uk"
         self.rate_limit_delay = rate_limit_delay
-        self._last_request_time = 0.0
+        self.max_concurrency = max_concurrency
+        self.section_cache_size = section_cache_size
+        # (type, year, number, section) -> shared task resolving to the parsed
+        # section. Pending tasks let concurrent callers share one fetch.
+        self._sections: OrderedDict[tuple, SharedTask] = OrderedDict()
+        # (url, missing_ok, force, revalidate) -> document load in progress,
+        # so e.g. metadata and whole-Act requests for one Act share a download
+        self._inflight: dict[tuple[str, bool, bool, bool], SharedTask] = {}
+        # Cache directories known to exist, so writes skip the mkdir syscalls
+        self._cache_dirs: set[Path] = set()
+        # Allow up to one second's worth of requests to burst
+        self._bucket: TokenBucket | None = None
+        if rate_limit_delay > 0:
+            self._bucket = TokenBucket(
+                rate=1 / rate_limit_delay,
+                capacity=max(1, int(1 / rate_limit_delay)),
+            )
+        self._client: _http.AsyncClient | None = None
+
+    async def __aenter__(self) -> "UKLegislationFetcher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client, if opened."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _parse(self, parser: Callable[[bytes], T], xml_bytes: bytes) -> T:
+        """Run a CLML parser in a worker thread, off the event loop."""
+        return await asyncio.to_thread(parser, xml_bytes)
+
+    def _get_client(self) -> _http.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            # HTTP/2 multiplexes concurrent section fetches over a few connections
+            self._client = _http.AsyncClient(
+                headers={"User-Agent": USER_AGENT},
+                follow_redirects=True,
+                timeout=60,
+                http2=True,
+                limits=_http.Limits(max_connections=4, max_keepalive_connections=4),
+            )
+        return self._client
+
+    async def _get(self, url: str, **kwargs: Any) -> Any:
+        """GET a URL on the shared client.
+
+        Raises:
+            httpx.RequestError: If the request fails, whichever client is in use
+        """
+        try:
+            return await self._get_client().get(url, **kwargs)
+        except _http.HTTPError as e:
+            if _http is httpx:
+                raise
+            raise _as_httpx_error(e) from e
 
     def build_url(self, citation: UKCitation, version: str = "") -> str:
         """Build the XML data URL for a citation.
@@ -178,13 +439,10 @@ class UKLegislationFetcher:
         Returns:
             URL to fetch XML data
         """
-        url = f"{self.base_url}/{citation.type}/{citation.year}/{citation.number}"
-        if citation.section:
-            url += f"/section/{citation.section}"
-        if version:
-            url += f"/{version}"
-        url += "/data.xml"
-        return url
+        prefix = _act_prefix(self.base_url, citation.type, citation.year, citation.number)
+        section = f"/section/{citation.section}" if citation.section else ""
+        version = f"/{version}" if version else ""
+        return f"{prefix}{section}{version}/data.xml"
 
     def build_search_url(
         self,
@@ -213,36 +471,58 @@ class UKLegislationFetcher:
 
     async def _rate_limit(self) -> None:
         """Enforce rate limiting between requests."""
-        import time
-        now = time.time()
-        elapsed = now - self._last_request_time
-        if elapsed < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - elapsed)
-        self._last_request_time = time.time()
-
-    async def _fetch_xml(self, url: str) -> str:
+        if self._bucket is not None:
+            await self._bucket.acquire()
+
+    async def _fetch_xml(
+        self,
+        url: str,
+        entry: CacheEntry | None = None,
+        missing_ok: bool = False,
+    ) -> FetchResult:
         """Fetch XML from URL with rate limiting.
 
+        The raw response body is returned undecoded; the CLML parsers read
+        bytes directly and the cache stores them as-is.
+
         Args:
             url: URL to fetch
+            entry: Cache entry to revalidate. Its validators are sent as
+                conditional headers and updated from the response.
+            missing_ok: Report 404 as a status instead of raising
 
         Returns:
-            XML string
+            FetchResult. Status 304 (Not Modified) and, with ``missing_ok``,
+            404 come back with an empty body.
+
+        Transient failures (429 and 502-504) are retried with exponential
+        backoff and jitter, honouring any ``Retry-After`` header.
 
         Raises:
             httpx.HTTPError: If request fails
         """
-        await self._rate_limit()
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers={"User-Agent": "Arch/1.0 (https://github.com/CosilicoAI/arch)"},
-                follow_redirects=True,
-                timeout=60,
+        headers = entry.conditional_headers() if entry is not None else None
+        for attempt in range(MAX_ATTEMPTS):
+            await self._rate_limit()
+            response = await self._get(url, headers=headers)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_ATTEMPTS - 1:
+                break
+            delay = _retry_delay(attempt, response.headers.get("Retry-After"))
+            logger.warning(
+                f"{url} returned {response.status_code}, retrying in {delay:.1f}s"
             )
-            response.raise_for_status()
-            return response.text
+            await asyncio.sleep(delay)
+
+        if (response.status_code == 304 and entry is not None) or (
+            response.status_code == 404 and missing_ok
+        ):
+            return FetchResult(response.status_code, b"")
+        _raise_for_status(response, url)
+
+        if entry is not None:
+            entry.etag = response.headers.get("ETag")
+            entry.last_modified = response.headers.get("Last-Modified")
+        return FetchResult(response.status_code, response.content)
 
     def _cache_path(self, citation: UKCitation) -> Path:
         """Get cache file path for a citation."""
@@ -251,43 +531,233 @@ class UKLegislationFetcher:
             return path / f"section-{citation.section}.xml"
         return path / "act.xml"
 
+    @staticmethod
+    def _read_cache(cache_path: Path) -> bytes | None:
+        """Read cached XML, or return None if it has not been cached."""
+        try:
+            return cache_path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create a cache directory once per fetcher."""
+        if directory not in self._cache_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._cache_dirs.add(directory)
+
+    def _write_cache(self, entry: CacheEntry, xml_bytes: bytes) -> None:
+        """Write XML and its validators to the cache."""
+        self._ensure_dir(entry.path.parent)
+        atomic_write_bytes(entry.path, xml_bytes)
+        entry.save()
+
+    async def _read_or_fetch(
+        self,
+        url: str,
+        cache_path: Path,
+        cache: bool,
+        force: bool,
+        revalidate: bool = False,
+        missing_ok: bool = False,
+    ) -> bytes | None:
+        """Return XML from the cache, fetching it on a miss.
+
+        Disk I/O runs in a worker thread so it doesn't block other fetches.
+        Concurrent calls for the same URL and options share a single load,
+        which is cancelled only if every caller gives up.
+
+        Args:
+            url: URL to fetch on a cache miss
+            cache_path: Cache file for the document
+            cache: Whether to cache fetched XML
+            force: Re-fetch even if cached
+            revalidate: Check a cached copy with a conditional GET and only
+                download the body if it has changed
+            missing_ok: Return None for a 404 instead of raising
+
+        Returns:
+            XML bytes, or None if the document doesn't exist and ``missing_ok``
+        """
+        key = (url, missing_ok, force, revalidate)
+        shared = self._inflight.get(key)
+        if shared is None or shared.abandoned:
+            shared = SharedTask(
+                asyncio.ensure_future(
+                    self._load_document(url, cache_path, cache, force, revalidate, missing_ok)
+                )
+            )
+            self._inflight[key] = shared
+            shared.task.add_done_callback(
+                functools.partial(self._forget_inflight, key, shared)
+            )
+        return await shared.wait()
+
+    def _forget_inflight(self, key: tuple, shared: SharedTask, task: asyncio.Future) -> None:
+        """Drop a shared document load once it has finished."""
+        if self._inflight.get(key) is shared:
+            del self._inflight[key]
+        _consume_exception(task)
+
+    async def _load_document(
+        self,
+        url: str,
+        cache_path: Path,
+        cache: bool,
+        force: bool,
+        revalidate: bool,
+        missing_ok: bool,
+    ) -> bytes | None:
+        """Cache lookup and fetch behind ``_read_or_fetch``'s coalescing."""
+        xml_bytes = None
+        if not force:
+            xml_bytes = await asyncio.to_thread(self._read_cache, cache_path)
+            if xml_bytes is not None and not revalidate:
+                return xml_bytes
+
+        if xml_bytes is not None:
+            entry = await asyncio.to_thread(CacheEntry.load, cache_path)
+        else:
+            entry = CacheEntry(cache_path)
+
+        result = await self._fetch_xml(url, entry, missing_ok=missing_ok)
+        if result.status == 304:
+            # Not Modified - the cached copy is current
+            return xml_bytes
+        if result.status == 404:
+            return None
+
+        if cache:
+            await asyncio.to_thread(self._write_cache, entry, result.content)
+        return result.content
+
+    @staticmethod
+    def _section_key(citation: UKCitation) -> tuple:
+        """Key for a section in the in-memory cache."""
+        return (citation.type, citation.year, citation.number, citation.section)
+
+    def _remember_section(self, key: tuple, shared: SharedTask) -> None:
+        """Add a section to the in-memory LRU, evicting the oldest if full."""
+        self._sections[key] = shared
+        self._sections.move_to_end(key)
+        while len(self._sections) > self.section_cache_size:
+            self._sections.popitem(last=False)
+
     async def fetch_section(
         self,
         citation: UKCitation,
         cache: bool = True,
         force: bool = False,
-    ) -> UKSection:
+        revalidate: bool = False,
+        missing_ok: bool = False,
+    ) -> UKSection | None:
         """Fetch a single section.
 
         Args:
             citation: Citation with section number
             cache: Whether to cache the XML
             force: Re-fetch even if cached
+            revalidate: Check the cached copy is current with a conditional GET
+            missing_ok: Return None if the section doesn't exist instead of
+                raising ``httpx.HTTPStatusError``
 
         Returns:
-            UKSection object
+            UKSection object, or None if missing and ``missing_ok``
+        """
+        section = await self._shared_section(citation, cache, force, revalidate)
+        if section is None and not missing_ok:
+            # Shared fetches treat 404 as None so strict and missing_ok callers
+            # can join the same one; strict callers raise here instead
+            request = httpx.Request("GET", self.build_url(citation))
+            httpx.Response(404, request=request).raise_for_status()
+        return section
+
+    async def _shared_section(
+        self,
+        citation: UKCitation,
+        cache: bool,
+        force: bool,
+        revalidate: bool,
+    ) -> UKSection | None:
+        """Return a section from the in-memory cache, or join or start its fetch."""
+        key = self._section_key(citation)
+        if not (force or revalidate):
+            cached = self._sections.get(key)
+            if cached is not None and not cached.abandoned:
+                self._sections.move_to_end(key)
+                if cached.task.done():
+                    return cached.task.result()
+                return await cached.wait()
+
+        # Run the fetch in its own task so no single caller owns it
+        shared = SharedTask(
+            asyncio.ensure_future(self._load_section(citation, cache, force, revalidate))
+        )
+        self._remember_section(key, shared)
+        shared.task.add_done_callback(functools.partial(self._settle_section, key, shared))
+        return await shared.wait()
+
+    async def _load_section(
+        self,
+        citation: UKCitation,
+        cache: bool,
+        force: bool,
+        revalidate: bool,
+    ) -> UKSection | None:
+        """Fetch and parse a section, or return None if it doesn't exist."""
+        xml_bytes = await self._read_or_fetch(
+            self.build_url(citation),
+            self._cache_path(citation),
+            cache=cache,
+            force=force,
+            revalidate=revalidate,
+            missing_ok=True,
+        )
+        if xml_bytes is None:
+            return None
+        return await self._parse(parse_section, xml_bytes)
+
+    def _settle_section(self, key: tuple, shared: SharedTask, task: asyncio.Future) -> None:
+        """Evict a finished section fetch that failed or found nothing.
+
+        Failures (including abandoned fetches) aren't remembered, and
+        neither are missing sections, so a later strict fetch still raises.
         """
-        cache_path = self._cache_path(citation)
+        failed = task.cancelled() or task.exception() is not None
+        if (failed or task.result() is None) and self._sections.get(key) is shared:
+            del self._sections[key]
 
-        # Check cache
-        if not force and cache_path.exists():
-            xml_str = cache_path.read_text()
-        else:
-            url = self.build_url(citation)
-            xml_str = await self._fetch_xml(url)
+    async def fetch_act_xml(
+        self,
+        citation: UKCitation,
+        cache: bool = True,
+        force: bool = False,
+        revalidate: bool = False,
+    ) -> bytes:
+        """Fetch the raw CLML of a whole Act, from the cache when possible.
 
-            # Save to cache
-            if cache:
-                cache_path.parent.mkdir(parents=True, exist_ok=True)
-                cache_path.write_text(xml_str)
+        Args:
+            citation: Citation without section
+            cache: Whether to cache the XML
+            force: Re-fetch even if cached
+            revalidate: Check the cached copy is current with a conditional GET
 
-        return parse_section(xml_str)
+        Returns:
+            The Act's XML as bytes
+        """
+        return await self._read_or_fetch(
+            self.build_url(citation),
+            self._cache_path(citation),
+            cache=cache,
+            force=force,
+            revalidate=revalidate,
+        )
 
     async def fetch_act_metadata(
         self,
         citation: UKCitation,
         cache: bool = True,
         force: bool = False,
+        revalidate: bool = False,
     ) -> UKAct:
         """Fetch Act-level metadata.
 
@@ -295,64 +765,149 @@ class UKLegislationFetcher:
             citation: Citation without section
             cache: Whether to cache the XML
             force: Re-fetch even if cached
+            revalidate: Check the cached copy is current with a conditional GET
 
         Returns:
             UKAct object with metadata
         """
-        cache_path = self._cache_path(citation)
+        xml_bytes = await self.fetch_act_xml(
+            citation, cache=cache, force=force, revalidate=revalidate
+        )
+        return await self._parse(parse_act_metadata, xml_bytes)
 
-        if not force and cache_path.exists():
-            xml_str = cache_path.read_text()
-        else:
-            url = self.build_url(citation)
-            xml_str = await self._fetch_xml(url)
+    async def fetch_contents(
+        self,
+        citation: UKCitation,
+        cache: bool = True,
+        force: bool = False,
+        revalidate: bool = False,
+    ) -> list[str]:
+        """Fetch the section numbers listed in an Act's table of contents.
+
+        Args:
+            citation: Citation without section
+            cache: Whether to cache the XML
+            force: Re-fetch even if cached
+            revalidate: Check the cached copy is current with a conditional GET
+
+        Returns:
+            Section numbers in document order; empty if the Act has no
+            contents document
+        """
+        prefix = _act_prefix(self.base_url, citation.type, citation.year, citation.number)
+        url = f"{prefix}/contents/data.xml"
+        cache_path = self._cache_path(citation).with_name("contents.xml")
+        xml_bytes = await self._read_or_fetch(
+            url, cache_path, cache=cache, force=force, revalidate=revalidate, missing_ok=True
+        )
+        if xml_bytes is None:
+            return []
+        return await self._parse(parse_contents_sections, xml_bytes)
+
+    async def fetch_act_whole(
+        self,
+        citation: UKCitation,
+        cache: bool = True,
+        force: bool = False,
+        revalidate: bool = False,
+    ) -> list[UKSection]:
+        """Fetch every section of an Act with a single whole-Act request.
+
+        Uses the same document (and cache file) as ``fetch_act_metadata``.
+        Parsed sections are also added to the in-memory section cache.
+
+        Args:
+            citation: Citation without section
+            cache: Whether to cache the XML
+            force: Re-fetch even if cached
+            revalidate: Check the cached copy is current with a conditional GET
+
+        Returns:
+            UKSection objects in document order
+        """
+        xml_bytes = await self._read_or_fetch(
+            self.build_url(citation),
+            self._cache_path(citation),
+            cache=cache,
+            force=force,
+            revalidate=revalidate,
+        )
+        sections = await self._parse(parse_act_sections, xml_bytes)
 
-            if cache:
-                cache_path.parent.mkdir(parents=True, exist_ok=True)
-                cache_path.write_text(xml_str)
+        loop = asyncio.get_running_loop()
+        # Slice from an explicit start: a size of 0 would make [-0:] the whole list
+        for section in sections[max(len(sections) - self.section_cache_size, 0):]:
+            future: asyncio.Future[UKSection | None] = loop.create_future()
+            future.set_result(section)
+            self._remember_section(self._section_key(section.citation), SharedTask(future))
 
-        return parse_act_metadata(xml_str)
+        return sections
 
     async def fetch_act_sections(
         self,
         citation: UKCitation,
         max_sections: Optional[int] = None,
-    ) -> Iterator[UKSection]:
+    ) -> AsyncIterator[UKSection]:
         """Fetch all sections from an Act.
 
+        Per-section fetches all run concurrently; each section is yielded
+        as soon as it and every section before it have arrived, so callers
+        can start processing before the whole Act is downloaded.
+
         Args:
             citation: Citation for the Act
             max_sections: Maximum sections to fetch
 
         Yields:
-            UKSection objects
+            UKSection objects in document order
         """
-        # First, get the Act metadata to find section count
-        act = await self.fetch_act_metadata(citation)
-        section_count = act.section_count or 1000  # Default max
+        # Large requests: download the whole Act once instead of per section
+        if max_sections is None or max_sections > WHOLE_ACT_THRESHOLD:
+            sections = await self.fetch_act_whole(citation)
+            if sections:
+                for section in sections[:max_sections] if max_sections else sections:
+                    yield section
+                return
+
+        # Enumerate the real sections from the table of contents, falling back
+        # to probing numeric sections up to the Act's provision count
+        section_ids = await self.fetch_contents(citation)
+        if not section_ids:
+            act = await self.fetch_act_metadata(citation)
+            section_count = act.section_count or 1000  # Default max
+            section_ids = [str(i) for i in range(1, section_count + 1)]
 
         if max_sections:
-            section_count = min(section_count, max_sections)
+            section_ids = section_ids[:max_sections]
 
-        # Fetch sections (legislation.gov.uk uses numeric sections)
-        sections = []
-        for i in range(1, section_count + 1):
-            try:
-                section_citation = UKCitation(
-                    type=citation.type,
-                    year=citation.year,
-                    number=citation.number,
-                    section=str(i),
-                )
-                section = await self.fetch_section(section_citation)
-                sections.append(section)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    # Section doesn't exist, skip
-                    continue
-                raise
+        # Create the Act's cache directory up front rather than per section
+        await asyncio.to_thread(self._ensure_dir, self._cache_path(citation).parent)
 
-        return iter(sections)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch_bounded(section_id: str) -> UKSection | None:
+            section_citation = UKCitation(
+                type=citation.type,
+                year=citation.year,
+                number=citation.number,
+                section=section_id,
+            )
+            async with semaphore:
+                # Sections that don't exist come back as None and are skipped
+                return await self.fetch_section(section_citation, missing_ok=True)
+
+        tasks = [asyncio.ensure_future(fetch_bounded(section_id)) for section_id in section_ids]
+        try:
+            for task in tasks:
+                section = await task
+                if section is not None:
+                    yield section
+        finally:
+            # Stop outstanding fetches if the caller stops early or one fails.
+            # A section fetch is only cancelled once no other caller awaits it.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def list_all_ukpga_acts(
         self,
@@ -374,45 +929,39 @@ class UKLegislationFetcher:
         page = 1
         base_url = f"{self.base_url}/ukpga/data.feed"
 
-        async with httpx.AsyncClient() as client:
-            while True:
-                await self._rate_limit()
+        while True:
+            await self._rate_limit()
 
-                url = f"{base_url}?results-count={page_size}&page={page}"
-                if progress_callback:
-                    progress_callback(f"Fetching page {page}...")
+            url = f"{base_url}?results-count={page_size}&page={page}"
+            if progress_callback:
+                progress_callback(f"Fetching page {page}...")
 
-                response = await client.get(
-                    url,
-                    headers={"User-Agent": "Arch/1.0 (https://github.com/CosilicoAI/arch)"},
-                    follow_redirects=True,
-                    timeout=60,
-                )
-                response.raise_for_status()
+            response = await self._get(url)
+            _raise_for_status(response, url)
 
-                # Parse Atom feed
-                root = ET.fromstring(response.text)
+            # Parse Atom feed
+            root = ET.fromstring(response.text)
 
-                # Extract entries
-                entries_found = 0
-                for entry in root.findall("atom:entry", ATOM_NS):
-                    entries_found += 1
-                    act_ref = self._parse_feed_entry(entry)
-                    if act_ref:
-                        acts.append(act_ref)
+            # Extract entries
+            entries_found = 0
+            for entry in root.findall("atom:entry", ATOM_NS):
+                entries_found += 1
+                act_ref = self._parse_feed_entry(entry)
+                if act_ref:
+                    acts.append(act_ref)
 
-                if progress_callback:
-                    progress_callback(f"Page {page}: found {entries_found} entries, total {len(acts)} acts")
+            if progress_callback:
+                progress_callback(f"Page {page}: found {entries_found} entries, total {len(acts)} acts")
 
-                # Check for next page
-                next_link = root.find("atom:link[@rel='next']", ATOM_NS)
-                if next_link is None:
-                    # No more pages
-                    break
+            # Check for next page
+            next_link = root.find("atom:link[@rel='next']", ATOM_NS)
+            if next_link is None:
+                # No more pages
+                break
 
-                page += 1
-                if max_pages and page > max_pages:
-                    break
+            page += 1
+            if max_pages and page > max_pages:
+                break
 
         return acts
 
@@ -488,15 +1037,12 @@ class UKLegislationFetcher:
 
         await self._rate_limit()
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers={"User-Agent": "Arch/1.0 (https://github.com/CosilicoAI/arch)"},
-                follow_redirects=True,
-                timeout=120,  # Longer timeout for full acts
-            )
-            response.raise_for_status()
-            xml_content = response.text
+        response = await self._get(
+            url,
+            timeout=120,  # Longer timeout for full acts
+        )
+        _raise_for_status(response, url)
+        xml_content = response.text
 
         # Save to file
         output_path = output_dir / f"{act_ref.year}" / f"{act_ref.number}.xml"
@@ -604,22 +1150,35 @@ class UKLegislationFetcher:
         return progress
 
 
+def run_uk(main: Coroutine[Any, Any, T]) -> T:
+    """Run a UK fetcher coroutine to completion, on uvloop if installed.
+
+    Use instead of ``asyncio.run`` at entry points; the global event loop
+    policy is left untouched.
+    """
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
+
+
 async def download_uk_act(
-    act_ref: str,
+    act_ref: str | UKCitation,
     data_dir: Optional[Path] = None,
     max_sections: Optional[int] = None,
 ) -> list[UKSection]:
     """Convenience function to download an entire UK Act.
 
     Args:
-        act_ref: Act reference like "ukpga/2003/1"
+        act_ref: Act reference like "ukpga/2003/1", or an already parsed citation
         data_dir: Optional data directory
         max_sections: Optional limit on sections
 
     Returns:
         List of UKSection objects
     """
-    citation = UKCitation.from_string(act_ref)
-    fetcher = UKLegislationFetcher(data_dir=data_dir)
-    sections = await fetcher.fetch_act_sections(citation, max_sections=max_sections)
-    return list(sections)
+    citation = act_ref if isinstance(act_ref, UKCitation) else UKCitation.from_string(act_ref)
+    async with UKLegislationFetcher(data_dir=data_dir) as fetcher:
+        return [
+            section
+            async for section in fetcher.fetch_act_sections(citation, max_sections=max_sections)
+        ]
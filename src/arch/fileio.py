@@ -0,0 +1,23 @@
+"""Small filesystem helpers shared by fetchers and caches."""
+
+import os
+from pathlib import Path
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to a temp file beside ``path`` and rename it into place.
+
+    Readers never see a partially written file, even if the process dies
+    mid-write or two writers race on the same path. The temp file is
+    created with mode 0666 so the kernel applies the process umask, as a
+    plain ``write_bytes`` would.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.urandom(4).hex()}.tmp")
+    fd = os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
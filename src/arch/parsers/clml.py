@@ -10,6 +10,8 @@ Structure:
 Source: https://legislation.github.io/data-documentation/
 """
 
+import contextlib
+import io
 import re
 from datetime import date
 from typing import Optional
@@ -64,18 +66,20 @@ def parse_extent(extent_str: str) -> list[str]:
     return [e.strip() for e in extent_str.split("+")]
 
 
-def extract_citations(xml_str: str) -> list[str]:
+def extract_citations(xml_str: str | bytes) -> list[str]:
     """Extract citation URIs from XML.
 
     Args:
-        xml_str: XML string containing Citation elements
+        xml_str: XML string or raw bytes containing Citation elements
 
     Returns:
         List of citation URIs
     """
     # Find Citation URI attributes
-    pattern = r'URI="([^"]+)"'
-    matches = re.findall(pattern, xml_str)
+    if isinstance(xml_str, bytes):
+        matches = [m.decode("utf-8") for m in re.findall(rb'URI="([^"]+)"', xml_str)]
+    else:
+        matches = re.findall(r'URI="([^"]+)"', xml_str)
 
     # Filter to legislation.gov.uk URIs
     citations = []
@@ -155,60 +159,81 @@ def _parse_citation_from_uri(uri: str) -> Optional[UKCitation]:
     return None
 
 
+def _amendment_from_commentary(commentary: ET.Element, change_id: str, ns: dict) -> UKAmendment:
+    """Build a UKAmendment from the Commentary a substitution refers to."""
+    # Extract amending act from Citation
+    citation_elem = commentary.find(".//leg:Citation", ns)
+    amending_uri = citation_elem.get("URI", "") if citation_elem is not None else ""
+
+    # Extract date from commentary text
+    text = _get_text_content(commentary)
+    date_match = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{4})", text)
+    eff_date = date.today()
+    if date_match:
+        try:
+            eff_date = date(
+                int(date_match.group(3)),
+                int(date_match.group(2)),
+                int(date_match.group(1)),
+            )
+        except ValueError:
+            pass
+
+    # Extract citation path from URI
+    amending_act = ""
+    if amending_uri:
+        match = re.search(r"legislation\.gov\.uk/([a-z]+/\d+/\d+)", amending_uri)
+        if match:
+            amending_act = match.group(1)
+
+    return UKAmendment(
+        type="substitution",
+        amending_act=amending_act,
+        description=text[:200] if text else None,
+        effective_date=eff_date,
+        change_id=change_id,
+    )
+
+
+def _substitution_refs(elem: ET.Element, ns: dict) -> list[tuple[str, str]]:
+    """(ChangeId, CommentaryRef) of each Substitution within an element that cites a commentary."""
+    return [
+        (sub.get("ChangeId", ""), sub.get("CommentaryRef", ""))
+        for sub in elem.findall(".//leg:Substitution", ns)
+        if sub.get("CommentaryRef")
+    ]
+
+
+def _commentary_ids(elem: ET.Element) -> set[str]:
+    """IDs of the commentaries referred to from within an element."""
+    ref_tag = f"{{{NAMESPACES['leg']}}}CommentaryRef"
+    ids = set()
+    for child in elem.iter():
+        ref = child.get("Ref") if child.tag == ref_tag else child.get("CommentaryRef")
+        if ref:
+            ids.add(ref)
+    return ids
+
+
 def _parse_amendments(root: ET.Element, ns: dict) -> list[UKAmendment]:
     """Parse amendment information from Commentaries and Substitution elements."""
     amendments = []
 
     # Find Substitution/Addition/Repeal elements
-    for sub in root.findall(".//leg:Substitution", ns):
-        change_id = sub.get("ChangeId", "")
-        commentary_ref = sub.get("CommentaryRef", "")
-
+    for change_id, commentary_ref in _substitution_refs(root, ns):
         # Try to find the referenced commentary
-        if commentary_ref:
-            commentary = root.find(f".//leg:Commentary[@id='{commentary_ref}']", ns)
-            if commentary is not None:
-                # Extract amending act from Citation
-                citation_elem = commentary.find(".//leg:Citation", ns)
-                amending_uri = citation_elem.get("URI", "") if citation_elem is not None else ""
-
-                # Extract date from commentary text
-                text = _get_text_content(commentary)
-                date_match = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{4})", text)
-                eff_date = date.today()
-                if date_match:
-                    try:
-                        eff_date = date(
-                            int(date_match.group(3)),
-                            int(date_match.group(2)),
-                            int(date_match.group(1)),
-                        )
-                    except ValueError:
-                        pass
-
-                # Extract citation path from URI
-                amending_act = ""
-                if amending_uri:
-                    match = re.search(r"legislation\.gov\.uk/([a-z]+/\d+/\d+)", amending_uri)
-                    if match:
-                        amending_act = match.group(1)
-
-                amendments.append(UKAmendment(
-                    type="substitution",
-                    amending_act=amending_act,
-                    description=text[:200] if text else None,
-                    effective_date=eff_date,
-                    change_id=change_id,
-                ))
+        commentary = root.find(f".//leg:Commentary[@id='{commentary_ref}']", ns)
+        if commentary is not None:
+            amendments.append(_amendment_from_commentary(commentary, change_id, ns))
 
     return amendments
 
 
-def parse_section(xml_str: str) -> UKSection:
+def parse_section(xml_str: str | bytes) -> UKSection:
     """Parse a UK legislation section from CLML XML.
 
     Args:
-        xml_str: XML string containing a section
+        xml_str: XML string or raw bytes containing a section
 
     Returns:
         UKSection object
@@ -301,11 +326,11 @@ def parse_section(xml_str: str) -> UKSection:
     )
 
 
-def parse_act_metadata(xml_str: str) -> UKAct:
+def parse_act_metadata(xml_str: str | bytes) -> UKAct:
     """Parse Act-level metadata from CLML XML.
 
     Args:
-        xml_str: XML string containing Act metadata
+        xml_str: XML string or raw bytes containing Act metadata
 
     Returns:
         UKAct object
@@ -385,3 +410,138 @@ def parse_act_metadata(xml_str: str) -> UKAct:
         extent=extent,
         source_url=doc_uri,
     )
+
+
+def parse_contents_sections(xml_str: str | bytes) -> list[str]:
+    """Parse section numbers from an Act's table of contents.
+
+    The contents document (``/{type}/{year}/{number}/contents/data.xml``)
+    lists every provision as a ``<ContentsItem>`` whose DocumentURI points
+    at the section, e.g. ``.../ukpga/2003/1/section/62``.
+
+    Args:
+        xml_str: XML string or raw bytes of the contents document
+
+    Returns:
+        Section numbers in document order, without duplicates
+    """
+    root = ET.fromstring(xml_str)
+
+    sections: list[str] = []
+    seen: set[str] = set()
+    for item in root.iter(f"{{{NAMESPACES['leg']}}}ContentsItem"):
+        uri = item.get("DocumentURI") or item.get("IdURI") or ""
+        match = re.search(r"/section/(\d+[A-Za-z]*)(?:/|$)", uri)
+        if match and match.group(1) not in seen:
+            seen.add(match.group(1))
+            sections.append(match.group(1))
+
+    return sections
+
+
+def _citations_in(elem: ET.Element) -> list[str]:
+    """Extract citation paths from the URI attributes within an element.
+
+    Element-level counterpart of ``extract_citations``, which scans raw XML.
+    """
+    citations = []
+    for child in elem.iter():
+        for attr, uri in child.attrib.items():
+            if attr.endswith("URI"):
+                match = re.search(r"legislation\.gov\.uk/([a-z]+/\d+/\d+)", uri)
+                if match:
+                    citations.append(match.group(1))
+    return citations
+
+
+def parse_act_sections(xml_str: str | bytes) -> list[UKSection]:
+    """Split a whole-Act CLML document into its sections.
+
+    The document is stream-parsed and each section's ``<P1>`` is cleared
+    once converted, so only the Act's skeleton and commentaries stay in
+    memory. Substitutions and commentary references are resolved against
+    the Commentaries block, which follows the body, once the whole
+    document has been read.
+
+    Each section matches what ``parse_section`` returns for that section's
+    own document in citation, title, subsections, amendments and the
+    citations it references, including those in its commentaries. Two
+    things differ: ``text`` holds only the section's own text, without
+    the commentary notes a section document carries, and citations in
+    the Act-level metadata aren't attributed to every section.
+
+    Args:
+        xml_str: XML string or raw bytes of an entire Act
+
+    Returns:
+        UKSection objects in document order
+    """
+    ns = NAMESPACES
+    source = io.BytesIO(xml_str) if isinstance(xml_str, bytes) else io.StringIO(xml_str)
+    p1_tag = f"{{{ns['leg']}}}P1"
+    enactment_tag = f"{{{ns['ukm']}}}EnactmentDate"
+
+    root = None
+    enacted_date = date.today()
+    sections: list[UKSection] = []
+    # (section index, substitutions, commentary ids) for sections citing commentaries
+    pending: list[tuple[int, list[tuple[str, str]], set[str]]] = []
+
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if root is None:
+            root = elem
+            continue
+        if event != "end":
+            continue
+
+        if elem.tag == enactment_tag:
+            date_str = elem.get("Date", "")
+            if date_str:
+                with contextlib.suppress(ValueError):
+                    enacted_date = date.fromisoformat(date_str)
+            continue
+
+        if elem.tag != p1_tag:
+            continue
+
+        doc_uri = elem.get("DocumentURI", "")
+        citation = _parse_citation_from_uri(doc_uri)
+        if citation is None or not citation.section:
+            # Schedule paragraphs and un-addressed provisions
+            continue
+
+        text_parts = [_get_text_content(t) for t in elem.findall(".//leg:Text", ns)]
+        commentary_ids = _commentary_ids(elem)
+        if commentary_ids:
+            pending.append((len(sections), _substitution_refs(elem, ns), commentary_ids))
+
+        sections.append(UKSection(
+            citation=citation,
+            title=f"Section {citation.section}",
+            text="\n".join(text_parts),
+            subsections=_parse_subsections(elem, ns),
+            enacted_date=enacted_date,
+            extent=parse_extent(elem.get("RestrictExtent", "") or root.get("RestrictExtent", "")),
+            references_to=_citations_in(elem),
+            source_url=doc_uri,
+        ))
+        elem.clear()
+
+    if pending and root is not None:
+        commentaries = {
+            c.get("id"): c for c in root.iter(f"{{{ns['leg']}}}Commentary")
+        }
+        position = {commentary_id: i for i, commentary_id in enumerate(commentaries)}
+        for index, substitutions, commentary_ids in pending:
+            section = sections[index]
+            for change_id, commentary_ref in substitutions:
+                commentary = commentaries.get(commentary_ref)
+                if commentary is not None:
+                    section.amendments.append(
+                        _amendment_from_commentary(commentary, change_id, ns)
+                    )
+            # A section document lists its commentaries in Commentaries-block order
+            for commentary_id in sorted(commentary_ids & position.keys(), key=position.get):
+                section.references_to.extend(_citations_in(commentaries[commentary_id]))
+
+    return sections
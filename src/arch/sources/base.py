@@ -13,18 +13,33 @@ Source Types:
 """
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Callable
+from typing import Callable
 
 import httpx
 
 from arch.models_statute import Statute, StatuteSubsection
 
 
-@dataclass
+class _ReadOnlyDict(dict):
+    """A dict that rejects mutation, yet pickles, copies and serializes as one."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # Rebuild from a plain dict rather than item by item via __setitem__
+        return (type(self), (dict(self),))
+
+
+@dataclass(slots=True, frozen=True)
 class SourceConfig:
     """Configuration for a statute source.
 
@@ -50,7 +65,8 @@ class SourceConfig:
     history_selector: str | None = None
 
     # Codes available in this jurisdiction
-    codes: dict[str, str] = field(default_factory=dict)  # code_id -> code_name
+    codes: Mapping[str, str] = field(default_factory=dict)  # code_id -> code_name
+    code_ids: tuple[str, ...] = field(init=False, repr=False, compare=False)
 
     # Rate limiting
     rate_limit: float = 0.5  # seconds between requests
@@ -59,6 +75,15 @@ class SourceConfig:
     # Custom parsing
     custom_parser: str | None = None  # module path to custom parser function
 
+    # Validation settings when loaded from YAML: unquoted numeric code IDs
+    # (e.g. `1: State Government`) become strings
+    __pydantic_config__ = {"coerce_numbers_to_str": True}
+
+    def __post_init__(self) -> None:
+        # Configs are shared through the registry, so their codes can't change
+        object.__setattr__(self, "codes", _ReadOnlyDict(self.codes))
+        object.__setattr__(self, "code_ids", tuple(self.codes))
+
 
 class StatuteSource(ABC):
     """Abstract base class for statute sources.
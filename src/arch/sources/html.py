@@ -4,14 +4,32 @@ Most state legislatures publish statutes as HTML pages without APIs.
 This adapter handles common patterns with configurable selectors.
 """
 
+import functools
 import re
 from collections.abc import Iterator
 
 import httpx
+import soupsieve
 from bs4 import BeautifulSoup
 
 from arch.models_statute import Statute, StatuteSubsection
-from arch.sources.base import SourceConfig, StatuteSource
+from arch.sources.base import StatuteSource
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_selectors(selectors: str) -> tuple[soupsieve.SoupSieve, ...]:
+    """Compile a comma-separated list of fallback selectors, kept in priority order.
+
+    Each part is tried on its own, so a part can't itself contain commas
+    (``:is()`` lists, attribute values).
+    """
+    return tuple(soupsieve.compile(s.strip()) for s in selectors.split(","))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """Compile a whole CSS selector, matching the first element in document order."""
+    return soupsieve.compile(selector)
 
 
 class HTMLSource(StatuteSource):
@@ -52,8 +70,8 @@ class HTMLSource(StatuteSource):
         if not self.config.content_selector:
             return soup.body
 
-        for selector in self.config.content_selector.split(","):
-            content = soup.select_one(selector.strip())
+        for selector in _compile_selectors(self.config.content_selector):
+            content = selector.select_one(soup)
             if content:
                 return content
         return None
@@ -61,8 +79,8 @@ class HTMLSource(StatuteSource):
     def _find_title(self, soup: BeautifulSoup, section: str) -> str:
         """Find section title using configured selector."""
         if self.config.title_selector:
-            for selector in self.config.title_selector.split(","):
-                title_el = soup.select_one(selector.strip())
+            for selector in _compile_selectors(self.config.title_selector):
+                title_el = selector.select_one(soup)
                 if title_el:
                     return title_el.get_text(strip=True)
         return f"§ {section}"
@@ -70,7 +88,7 @@ class HTMLSource(StatuteSource):
     def _find_history(self, soup: BeautifulSoup) -> str | None:
         """Find history note using configured selector."""
         if self.config.history_selector:
-            history_el = soup.select_one(self.config.history_selector)
+            history_el = _compile_selector(self.config.history_selector).select_one(soup)
             if history_el:
                 return history_el.get_text(strip=True)
         return None
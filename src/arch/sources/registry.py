@@ -4,20 +4,227 @@ Maps jurisdiction IDs to source adapters and configurations.
 Configurations can be loaded from YAML files in sources/ directory.
 """
 
+import dataclasses
+import functools
+import hashlib
+import importlib
+import json
+import logging
+import os
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
-import yaml
-
+from arch.fileio import atomic_write_bytes
 from arch.sources.base import SourceConfig, StatuteSource
 
 if TYPE_CHECKING:
-    pass
+    from pydantic import TypeAdapter
+
+logger = logging.getLogger(__name__)
 
 
 # Source configs loaded from YAML or defined here
 _SOURCE_CONFIGS: dict[str, SourceConfig] = {}
 
+# Full scans that must re-parse more files than this read them on a thread
+# pool first; parsing holds the GIL, so it stays on the calling thread
+PARALLEL_YAML_THRESHOLD = 8
+
+# Values for required SourceConfig fields a YAML file may omit; optional
+# fields take their dataclass defaults during validation
+_YAML_DEFAULTS = {"source_type": "html", "base_url": ""}
+
+# Parsed YAML configs keyed by path, with the file's mtime (ns) when parsed
+_YAML_CACHE: dict[Path, tuple[int, SourceConfig | None]] = {}
+
+# Full scans are also saved to a per-directory file here, keyed by every
+# YAML file's mtime and size, so a fresh process can skip parsing YAML
+SCAN_CACHE_DIR = Path.home() / ".arch" / "cache"
+
+# Bump when the saved scan's layout changes
+SCAN_CACHE_VERSION = 1
+
+# Full-scan results keyed by directory, with the directory's mtime (ns).
+# Adding, removing or renaming a file bumps it; in-place edits don't.
+_DIR_CACHE: dict[Path, tuple[int, dict[str, SourceConfig]]] = {}
+
+
+@functools.cache
+def _source_config_adapter() -> "TypeAdapter[SourceConfig]":
+    """Compiled pydantic validator for SourceConfig, built on first use."""
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(SourceConfig)
+
+
+def _parse_yaml_config(yaml_file: Path, content: bytes | None = None) -> SourceConfig | None:
+    """Parse one YAML source config, or return None if the file is empty.
+
+    ``content`` may pass in the file's bytes if they've already been read.
+
+    Raises:
+        yaml.YAMLError: If the file isn't valid YAML
+        ValueError: If the config doesn't validate as a SourceConfig
+    """
+    # Imported here so built-in lookups never pay for PyYAML
+    import yaml
+
+    # libyaml's C loader is several times faster; fall back to pure Python
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    if content is None:
+        content = yaml_file.read_bytes()
+    data = yaml.load(content, Loader=loader)
+
+    if not data:
+        return None
+    if not isinstance(data, dict):
+        raise ValueError(f"expected a mapping, got {type(data).__name__}")
+
+    jurisdiction = data.get("jurisdiction", yaml_file.stem)
+    merged = {"name": jurisdiction, **_YAML_DEFAULTS} | data
+    merged["jurisdiction"] = jurisdiction
+    return _source_config_adapter().validate_python(merged)
+
+
+def _default_sources_dir() -> Path:
+    """The repository's sources/ directory of YAML configs."""
+    return Path(__file__).parent.parent.parent.parent / "sources"
+
+
+def _list_yaml_jurisdictions(sources_dir: Path | None = None) -> set[str]:
+    """Jurisdictions with a YAML config file, without parsing any of them."""
+    return set(_scan_yaml_files(sources_dir))
+
+
+def _scan_yaml_files(sources_dir: Path | None = None) -> dict[str, os.stat_result]:
+    """Stat every YAML config in one directory pass, keyed by jurisdiction."""
+    sources_dir = sources_dir or _default_sources_dir()
+    try:
+        with os.scandir(sources_dir) as entries:
+            return {
+                entry.name[: -len(".yaml")]: entry.stat()
+                for entry in entries
+                if entry.name.endswith(".yaml") and entry.is_file()
+            }
+    except FileNotFoundError:
+        return {}
+
+
+def _load_one_yaml_config(
+    jurisdiction: str,
+    sources_dir: Path | None = None,
+    stat: os.stat_result | None = None,
+    content: bytes | None = None,
+) -> SourceConfig | None:
+    """Load the YAML config for one jurisdiction, if it has a file.
+
+    Parsed files are cached and only re-parsed when their mtime changes.
+    ``stat`` and ``content`` may pass in the file's stat from a directory
+    scan and bytes read ahead of parsing.
+    """
+    sources_dir = sources_dir or _default_sources_dir()
+    yaml_file = sources_dir / f"{jurisdiction}.yaml"
+
+    try:
+        mtime = (stat or yaml_file.stat()).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    cached = _YAML_CACHE.get(yaml_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    import yaml
+
+    try:
+        config = _parse_yaml_config(yaml_file, content)
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        logger.warning(f"Error loading {yaml_file}: {e}")
+        return None
+
+    _YAML_CACHE[yaml_file] = (mtime, config)
+    return config
+
+
+def _scan_key(stats: dict[str, os.stat_result]) -> str:
+    """Fingerprint of a directory's YAML files (names, mtimes, sizes).
+
+    The cache format version and SourceConfig's fields and defaults are
+    included too, so an upgrade that changes the schema re-parses the YAML.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    schema = [(f.name, repr(f.default)) for f in dataclasses.fields(SourceConfig)]
+    digest.update(f"v{SCAN_CACHE_VERSION}:{schema}\n".encode())
+    for stem, stat in sorted(stats.items()):
+        digest.update(f"{stem}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+def _scan_cache_file(sources_dir: Path) -> Path:
+    """Where the full scan of a sources directory is saved."""
+    name = hashlib.blake2b(str(sources_dir.resolve()).encode(), digest_size=8).hexdigest()
+    return SCAN_CACHE_DIR / f"sources-{name}.json"
+
+
+def _read_scan_cache(cache_file: Path, key: str) -> dict[str, SourceConfig] | None:
+    """Load a saved full scan, or None if it's missing, stale or unreadable."""
+    try:
+        with open(cache_file, "rb") as f:
+            cached = json.load(f)
+        if cached["key"] != key:
+            return None
+        return {j: SourceConfig(**fields) for j, fields in cached["configs"].items()}
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+
+def _write_scan_cache(cache_file: Path, key: str, configs: dict[str, SourceConfig]) -> None:
+    """Save a full scan atomically; skipped if the cache directory isn't writable."""
+    fields = [f.name for f in dataclasses.fields(SourceConfig) if f.init]
+    data = json.dumps(
+        {
+            "key": key,
+            "configs": {
+                j: {name: getattr(c, name) for name in fields} for j, c in configs.items()
+            },
+        }
+    )
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(cache_file, data.encode("utf-8"))
+    except OSError as e:
+        logger.debug(f"Not caching source configs in {cache_file}: {e}")
+
+
+def _read_stale_yaml(
+    sources_dir: Path, stats: dict[str, os.stat_result]
+) -> dict[str, bytes]:
+    """Read the YAML files that need re-parsing, in parallel if there are many.
+
+    Files whose parsed config is still cached are skipped. Files that can't
+    be read are left out and reported when they are loaded.
+    """
+    stale = []
+    for stem, stat in stats.items():
+        cached = _YAML_CACHE.get(sources_dir / f"{stem}.yaml")
+        if cached is None or cached[0] != stat.st_mtime_ns:
+            stale.append(stem)
+    if len(stale) <= PARALLEL_YAML_THRESHOLD:
+        return {}
+
+    def read(stem: str) -> bytes | None:
+        try:
+            return (sources_dir / f"{stem}.yaml").read_bytes()
+        except OSError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+        contents = dict(zip(stale, pool.map(read, stale), strict=True))
+    return {stem: content for stem, content in contents.items() if content is not None}
+
 
 def _load_yaml_configs(sources_dir: Path | None = None) -> dict[str, SourceConfig]:
     """Load source configurations from YAML files.
@@ -26,49 +233,48 @@ def _load_yaml_configs(sources_dir: Path | None = None) -> dict[str, SourceConfi
     - sources/us.yaml
     - sources/us-ca.yaml
     - sources/us-ny.yaml
+
+    While the directory's mtime is unchanged the previous scan is reused,
+    and a scan saved by an earlier process is used while no file changed.
     """
-    sources_dir = sources_dir or Path(__file__).parent.parent.parent.parent / "sources"
+    sources_dir = sources_dir or _default_sources_dir()
+    try:
+        dir_mtime = sources_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
 
-    configs = {}
-    if not sources_dir.exists():
-        return configs
+    cached = _DIR_CACHE.get(sources_dir)
+    if cached is not None and cached[0] == dir_mtime:
+        return dict(cached[1])
 
-    for yaml_file in sources_dir.glob("*.yaml"):
-        try:
-            with open(yaml_file) as f:
-                data = yaml.safe_load(f)
+    stats = _scan_yaml_files(sources_dir)
+    key = _scan_key(stats)
+    cache_file = _scan_cache_file(sources_dir)
 
-            if not data:
-                continue
+    configs = _read_scan_cache(cache_file, key)
+    if configs is None:
+        stems = sorted(stats)
+        contents = _read_stale_yaml(sources_dir, stats)
+        loaded = [
+            _load_one_yaml_config(stem, sources_dir, stats[stem], contents.get(stem))
+            for stem in stems
+        ]
+        configs = {config.jurisdiction: config for config in loaded if config is not None}
+        _write_scan_cache(cache_file, key, configs)
 
-            jurisdiction = data.get("jurisdiction", yaml_file.stem)
-            configs[jurisdiction] = SourceConfig(
-                jurisdiction=jurisdiction,
-                name=data.get("name", jurisdiction),
-                source_type=data.get("source_type", "html"),
-                base_url=data.get("base_url", ""),
-                api_key=data.get("api_key"),
-                section_url_pattern=data.get("section_url_pattern"),
-                toc_url_pattern=data.get("toc_url_pattern"),
-                content_selector=data.get("content_selector"),
-                title_selector=data.get("title_selector"),
-                history_selector=data.get("history_selector"),
-                codes=data.get("codes", {}),
-                rate_limit=data.get("rate_limit", 0.5),
-                max_retries=data.get("max_retries", 3),
-                custom_parser=data.get("custom_parser"),
-            )
-        except Exception as e:
-            print(f"Error loading {yaml_file}: {e}")
+    _DIR_CACHE[sources_dir] = (dir_mtime, configs)
+    return dict(configs)
 
-    return configs
 
+@functools.cache
+def _get_builtin_configs() -> Mapping[str, SourceConfig]:
+    """Get built-in source configurations.
 
-def _get_builtin_configs() -> dict[str, SourceConfig]:
-    """Get built-in source configurations."""
+    Built once and shared; the mapping is read-only.
+    """
     from arch.sources.uslm import get_federal_config
 
-    return {
+    return MappingProxyType({
         "us": get_federal_config(),
         # Ohio
         "us-oh": SourceConfig(
@@ -4199,24 +4405,49 @@ def _get_builtin_configs() -> dict[str, SourceConfig]:
                 "42": "Wills, Decedents Estates, and Probate Code",
             },
         ),
-    }
+    })
 
 
 def get_all_configs() -> dict[str, SourceConfig]:
     """Get all source configurations (built-in + YAML)."""
-    global _SOURCE_CONFIGS
-
     if not _SOURCE_CONFIGS:
-        _SOURCE_CONFIGS = _get_builtin_configs()
+        _SOURCE_CONFIGS.update(_get_builtin_configs())
         _SOURCE_CONFIGS.update(_load_yaml_configs())
 
     return _SOURCE_CONFIGS
 
 
 def get_config_for_jurisdiction(jurisdiction: str) -> SourceConfig | None:
-    """Get source configuration for a jurisdiction."""
-    configs = get_all_configs()
-    return configs.get(jurisdiction.lower())
+    """Get source configuration for a jurisdiction.
+
+    Until the full registry has been built, a jurisdiction with its own
+    YAML file is loaded from that file alone, and other jurisdictions are
+    looked up in the built-in configs.
+    """
+    jurisdiction = jurisdiction.lower()
+    if not _SOURCE_CONFIGS:
+        config = _load_one_yaml_config(jurisdiction)
+        if config is not None and config.jurisdiction == jurisdiction:
+            return config
+        config = _get_builtin_configs().get(jurisdiction)
+        if config is not None:
+            return config
+    return get_all_configs().get(jurisdiction)
+
+
+# source_type -> (module, class); unknown types fall back to the HTML scraper
+_ADAPTER_CLASSES = {
+    "uslm": ("arch.sources.uslm", "USLMSource"),
+    "api": ("arch.sources.api", "APISource"),
+    "html": ("arch.sources.html", "HTMLSource"),
+}
+
+
+@functools.cache
+def _adapter_class(source_type: str) -> type[StatuteSource]:
+    """Resolve (and import once) the adapter class for a source type."""
+    module_name, class_name = _ADAPTER_CLASSES.get(source_type, _ADAPTER_CLASSES["html"])
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 def get_source_for_jurisdiction(jurisdiction: str) -> StatuteSource | None:
@@ -4232,23 +4463,11 @@ def get_source_for_jurisdiction(jurisdiction: str) -> StatuteSource | None:
     if not config:
         return None
 
-    # Select adapter based on source type
-    if config.source_type == "uslm":
-        from arch.sources.uslm import USLMSource
-
-        return USLMSource(config)
-    elif config.source_type == "api":
-        from arch.sources.api import APISource
-
-        if jurisdiction == "us-ny":
-            from arch.sources.api import NYLegislationSource
-
-            return NYLegislationSource(config.api_key)
-        return APISource(config)
-    else:
-        from arch.sources.html import HTMLSource
+    if config.source_type == "api" and jurisdiction == "us-ny":
+        from arch.sources.api import NYLegislationSource
 
-        return HTMLSource(config)
+        return NYLegislationSource(config.api_key)
+    return _adapter_class(config.source_type)(config)
 
 
 def list_supported_jurisdictions() -> list[dict]:
@@ -4259,7 +4478,7 @@ def list_supported_jurisdictions() -> list[dict]:
             "jurisdiction": j,
             "name": c.name,
             "source_type": c.source_type,
-            "codes": list(c.codes.keys()),
+            "codes": c.code_ids,
         }
         for j, c in sorted(configs.items())
     ]
@@ -4267,5 +4486,4 @@ def list_supported_jurisdictions() -> list[dict]:
 
 def register_source(jurisdiction: str, config: SourceConfig):
     """Register a source configuration."""
-    global _SOURCE_CONFIGS
-    _SOURCE_CONFIGS[jurisdiction.lower()] = config
+    get_all_configs()[jurisdiction.lower()] = config
@@ -4,7 +4,6 @@ The US Code is published in USLM (United States Legislative Markup) XML format
 at uscode.house.gov. This adapter parses the XML and converts to unified Statute model.
 """
 
-import re
 from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
@@ -3,12 +3,6 @@
 from arch.storage.base import StorageBackend
 from arch.storage.sqlite import SQLiteStorage
 
-# PostgreSQL is optional - only import if installed
-try:
-    from arch.storage.postgres import PostgresStorage
-except ImportError:
-    PostgresStorage = None  # type: ignore
-
 # R2 is optional - only import if boto3 is installed
 try:
     from arch.storage.r2 import R2Storage, get_r2
@@ -16,8 +10,20 @@ except ImportError:
     R2Storage = None  # type: ignore
     get_r2 = None  # type: ignore
 
-__all__ = ["StorageBackend", "SQLiteStorage"]
-if PostgresStorage is not None:
-    __all__.append("PostgresStorage")
+__all__ = ["StorageBackend", "SQLiteStorage", "PostgresStorage"]
 if R2Storage is not None:
     __all__.extend(["R2Storage", "get_r2"])
+
+
+def __getattr__(name: str):
+    # PostgreSQL is optional and pulls in SQLAlchemy - import on first use
+    if name == "PostgresStorage":
+        try:
+            from arch.storage import postgres
+        except ImportError:
+            backend = None
+        else:
+            backend = postgres.PostgresStorage
+        globals()[name] = backend
+        return backend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -131,6 +131,132 @@ SAMPLE_SECTION_WITH_AMENDMENT_XML = """<?xml version="1.0" encoding="UTF-8"?>
 </Legislation>
 """
 
+SAMPLE_CONTENTS_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<Legislation xmlns="http://www.legislation.gov.uk/namespaces/legislation"
+             xmlns:ukm="http://www.legislation.gov.uk/namespaces/metadata"
+             DocumentURI="http://www.legislation.gov.uk/ukpga/2003/1/contents">
+<Contents>
+    <ContentsTitle>Income Tax (Earnings and Pensions) Act 2003</ContentsTitle>
+    <ContentsPart DocumentURI="http://www.legislation.gov.uk/ukpga/2003/1/part/1">
+        <ContentsNumber>Part 1</ContentsNumber>
+        <ContentsItem ContentRef="section-1"
+                      DocumentURI="http://www.legislation.gov.uk/ukpga/2003/1/section/1"
+                      IdURI="http://www.legislation.gov.uk/id/ukpga/2003/1/section/1">
+            <ContentsNumber>1</ContentsNumber>
+            <ContentsTitle>Overview of contents of this Act</ContentsTitle>
+        </ContentsItem>
+        <ContentsItem ContentRef="section-4A"
+                      DocumentURI="http://www.legislation.gov.uk/ukpga/2003/1/section/4A">
+            <ContentsNumber>4A</ContentsNumber>
+        </ContentsItem>
+    </ContentsPart>
+    <ContentsSchedule DocumentURI="http://www.legislation.gov.uk/ukpga/2003/1/schedule/1">
+        <ContentsItem ContentRef="schedule-1-paragraph-1"
+                      DocumentURI="http://www.legislation.gov.uk/ukpga/2003/1/schedule/1/paragraph/1">
+            <ContentsNumber>1</ContentsNumber>
+        </ContentsItem>
+    </ContentsSchedule>
+</Contents>
+</Legislation>
+"""
+
+SAMPLE_WHOLE_ACT_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<Legislation xmlns="http://www.legislation.gov.uk/namespaces/legislation"
+             xmlns:ukm="http://www.legislation.gov.uk/namespaces/metadata"
+             xmlns:dc="http://purl.org/dc/elements/1.1/"
+             DocumentURI="http://www.legislation.gov.uk/ukpga/2003/1"
+             RestrictExtent="E+W+S+N.I.">
+<ukm:Metadata>
+    <dc:title>Income Tax (Earnings and Pensions) Act 2003</dc:title>
+    <ukm:EnactmentDate Date="2003-04-10"/>
+</ukm:Metadata>
+<Primary>
+    <Body>
+        <Part id="part-2">
+            <P1group>
+                <Title>Earnings</Title>
+                <P1 id="section-62" DocumentURI="http://www.legislation.gov.uk/ukpga/2003/1/section/62">
+                    <Pnumber>62</Pnumber>
+                    <P1para>
+                        <Text>"Earnings" means any salary, wages or fee.</Text>
+                    </P1para>
+                </P1>
+            </P1group>
+            <P1group>
+                <Title>Benefits</Title>
+                <P1 id="section-63" DocumentURI="http://www.legislation.gov.uk/ukpga/2003/1/section/63"
+                    RestrictExtent="E+W">
+                    <Pnumber>63</Pnumber>
+                    <P1para>
+                        <Text>The
+                            <Substitution ChangeId="c1" CommentaryRef="c100">benefit code</Substitution>
+                        applies.</Text>
+                    </P1para>
+                </P1>
+            </P1group>
+        </Part>
+    </Body>
+    <Schedules>
+        <P1 id="schedule-1-paragraph-1"
+            DocumentURI="http://www.legislation.gov.uk/ukpga/2003/1/schedule/1/paragraph/1">
+            <Text>Schedule text</Text>
+        </P1>
+    </Schedules>
+</Primary>
+<Commentaries>
+    <Commentary id="c100" Type="F">
+        <Para>
+            <Text>Words substituted by
+                <Citation URI="http://www.legislation.gov.uk/ukpga/2017/32">Finance Act 2017</Citation>
+                , s. 5(2), with effect from 16.11.2017.
+            </Text>
+        </Para>
+    </Commentary>
+</Commentaries>
+</Legislation>
+"""
+
+
+# Section 63 of SAMPLE_WHOLE_ACT_XML as served on its own
+SAMPLE_WHOLE_ACT_SECTION_63_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<Legislation xmlns="http://www.legislation.gov.uk/namespaces/legislation"
+             xmlns:ukm="http://www.legislation.gov.uk/namespaces/metadata"
+             xmlns:dc="http://purl.org/dc/elements/1.1/"
+             DocumentURI="http://www.legislation.gov.uk/ukpga/2003/1/section/63"
+             RestrictExtent="E+W">
+<ukm:Metadata>
+    <dc:title>Income Tax (Earnings and Pensions) Act 2003</dc:title>
+    <ukm:EnactmentDate Date="2003-04-10"/>
+</ukm:Metadata>
+<Primary>
+    <Body>
+        <P1group>
+            <Title>Benefits</Title>
+            <P1 id="section-63" DocumentURI="http://www.legislation.gov.uk/ukpga/2003/1/section/63"
+                RestrictExtent="E+W">
+                <Pnumber>63</Pnumber>
+                <P1para>
+                    <Text>The
+                        <Substitution ChangeId="c1" CommentaryRef="c100">benefit code</Substitution>
+                    applies.</Text>
+                </P1para>
+            </P1>
+        </P1group>
+    </Body>
+</Primary>
+<Commentaries>
+    <Commentary id="c100" Type="F">
+        <Para>
+            <Text>Words substituted by
+                <Citation URI="http://www.legislation.gov.uk/ukpga/2017/32">Finance Act 2017</Citation>
+                , s. 5(2), with effect from 16.11.2017.
+            </Text>
+        </Para>
+    </Commentary>
+</Commentaries>
+</Legislation>
+"""
+
 
 class TestCLMLParser:
     """Tests for parsing CLML section XML."""
@@ -223,6 +349,67 @@ class TestCLMLActParser:
         act = parse_act_metadata(SAMPLE_ACT_METADATA_XML)
         assert act.section_count == 725
 
+    def test_parse_act_metadata_from_bytes(self):
+        """Parse raw response bytes without decoding first."""
+        from arch.parsers.clml import parse_act_metadata
+
+        act = parse_act_metadata(SAMPLE_ACT_METADATA_XML.encode("utf-8"))
+        assert act.title == "Income Tax (Earnings and Pensions) Act 2003"
+        assert act.parts[1].title == "Employment income: charge to tax"
+
+
+class TestCLMLWholeActParser:
+    """Tests for splitting a whole-Act document into sections."""
+
+    def test_parse_act_sections(self):
+        """Each numbered section becomes a UKSection; schedules are skipped."""
+        from arch.parsers.clml import parse_act_sections
+
+        sections = parse_act_sections(SAMPLE_WHOLE_ACT_XML.encode("utf-8"))
+        assert [s.citation.section for s in sections] == ["62", "63"]
+        assert "salary" in sections[0].text
+        assert sections[0].enacted_date == date(2003, 4, 10)
+        assert sections[0].extent == ["E", "W", "S", "N.I."]
+        assert sections[1].extent == ["E", "W"]
+
+    def test_parse_act_sections_amendments(self):
+        """Substitutions are resolved against commentaries after the body."""
+        from arch.parsers.clml import parse_act_sections
+
+        sections = parse_act_sections(SAMPLE_WHOLE_ACT_XML)
+        assert sections[0].amendments == []
+        assert sections[1].amendments[0].amending_act == "ukpga/2017/32"
+        assert sections[1].amendments[0].effective_date == date(2017, 11, 16)
+
+    def test_parse_act_sections_matches_parse_section(self):
+        """A section split from the Act matches the parse of its own document."""
+        from arch.parsers.clml import parse_act_sections, parse_section
+
+        from_act = parse_act_sections(SAMPLE_WHOLE_ACT_XML)[1]
+        alone = parse_section(SAMPLE_WHOLE_ACT_SECTION_63_XML)
+
+        assert from_act.citation == alone.citation
+        assert from_act.title == alone.title == "Section 63"
+        assert from_act.subsections == alone.subsections
+        assert from_act.amendments == alone.amendments
+        assert from_act.enacted_date == alone.enacted_date
+        assert from_act.extent == alone.extent
+        # The section document also cites the Act from its root element
+        assert list(dict.fromkeys(from_act.references_to)) == list(
+            dict.fromkeys(alone.references_to)
+        )
+        assert "ukpga/2017/32" in from_act.references_to
+
+
+class TestCLMLContentsParser:
+    """Tests for parsing an Act's table of contents."""
+
+    def test_parse_contents_sections(self):
+        """List section numbers in order, ignoring schedule paragraphs."""
+        from arch.parsers.clml import parse_contents_sections
+
+        assert parse_contents_sections(SAMPLE_CONTENTS_XML) == ["1", "4A"]
+
 
 class TestCLMLAmendmentParsing:
     """Tests for parsing amendment information."""
@@ -279,6 +466,13 @@ class TestCLMLCitationExtraction:
         citations = extract_citations(xml)
         assert any("ukpga/2017/32" in c for c in citations)
 
+    def test_extract_citations_from_bytes(self):
+        """Bytes and text input yield the same citations."""
+        from arch.parsers.clml import extract_citations
+
+        xml = SAMPLE_SECTION_WITH_AMENDMENT_XML
+        assert extract_citations(xml.encode("utf-8")) == extract_citations(xml)
+
 
 class TestCLMLExtentParsing:
     """Tests for territorial extent parsing."""
@@ -0,0 +1,47 @@
+"""Tests for filesystem helpers."""
+
+from unittest.mock import patch
+
+
+class TestAtomicWriteBytes:
+    """Tests for atomic_write_bytes."""
+
+    def test_writes_and_leaves_no_temp_files(self, tmp_path):
+        """The file is replaced in one step and no temp files remain."""
+        from arch.fileio import atomic_write_bytes
+
+        path = tmp_path / "doc.xml"
+        path.write_bytes(b"old")
+        atomic_write_bytes(path, b"new")
+
+        assert path.read_bytes() == b"new"
+        assert [p.name for p in tmp_path.iterdir()] == ["doc.xml"]
+
+    def test_permissions_follow_umask_without_changing_it(self, tmp_path):
+        """The kernel applies the umask; the process umask is never touched."""
+        import os
+        import stat
+
+        from arch.fileio import atomic_write_bytes
+
+        umask = os.umask(0)
+        os.umask(umask)
+        path = tmp_path / "doc.xml"
+        with patch("os.umask", side_effect=AssertionError("umask changed")):
+            atomic_write_bytes(path, b"data")
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~umask
+
+    def test_failed_write_removes_temp_file(self, tmp_path):
+        """A write that fails midway leaves neither target nor temp file."""
+        import os
+
+        import pytest
+
+        from arch.fileio import atomic_write_bytes
+
+        with patch.object(os, "replace", side_effect=OSError("disk full")), \
+                pytest.raises(OSError):
+            atomic_write_bytes(tmp_path / "doc.xml", b"data")
+
+        assert list(tmp_path.iterdir()) == []
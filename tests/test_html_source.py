@@ -0,0 +1,80 @@
+"""Tests for the HTML statute source adapter."""
+
+from bs4 import BeautifulSoup
+
+SAMPLE_PAGE = """
+<html><head><title>Page title</title></head>
+<body>
+  <h1>Sec. 1. Definitions</h1>
+  <main><p>Main text</p></main>
+  <div class="history">Added 2020</div>
+</body></html>
+"""
+
+
+def make_source(**overrides):
+    from arch.sources.base import SourceConfig
+    from arch.sources.html import HTMLSource
+
+    config = SourceConfig(
+        jurisdiction="us-zz",
+        name="Test State",
+        source_type="html",
+        base_url="https://example.com",
+        **overrides,
+    )
+    return HTMLSource(config)
+
+
+class TestHTMLSelectors:
+    """Tests for configured CSS selectors."""
+
+    def test_selector_lists_are_tried_in_order(self):
+        """The first selector in a list that matches wins."""
+        source = make_source(
+            content_selector="div.content, main, body",
+            title_selector="h2, h1, title",
+            history_selector="div.history",
+        )
+        soup = BeautifulSoup(SAMPLE_PAGE, "html.parser")
+
+        assert source._find_content(soup).name == "main"
+        assert source._find_title(soup, "1") == "Sec. 1. Definitions"
+        assert source._find_history(soup) == "Added 2020"
+
+    def test_selectors_compiled_once(self):
+        """Selector lists are compiled once and reused across pages."""
+        from arch.sources.html import _compile_selectors
+
+        first = _compile_selectors("div.content, main, body")
+        assert _compile_selectors("div.content, main, body") is first
+        assert len(first) == 3
+
+    def test_history_selector_compiled_once(self):
+        """The history selector is compiled whole, once, and reused across pages."""
+        from arch.sources.html import _compile_selector
+
+        source = make_source(history_selector="div.notes, div.history")
+        soup = BeautifulSoup(SAMPLE_PAGE, "html.parser")
+        _compile_selector.cache_clear()
+
+        assert source._find_history(soup) == "Added 2020"
+        assert source._find_history(soup) == "Added 2020"
+        assert _compile_selector.cache_info().misses == 1
+
+    def test_history_selector_keeps_selector_list_semantics(self):
+        """A history selector list matches in document order and may contain commas."""
+        page = """
+        <body>
+          <p class="note">First note</p>
+          <div class="history">Added 2020</div>
+          <div data-kind="a,b">Amended 2021</div>
+        </body>
+        """
+        soup = BeautifulSoup(page, "html.parser")
+
+        source = make_source(history_selector="div.history, p.note")
+        assert source._find_history(soup) == "First note"
+
+        source = make_source(history_selector='div:is(.missing, [data-kind="a,b"])')
+        assert source._find_history(soup) == "Amended 2021"
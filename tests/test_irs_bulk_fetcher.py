@@ -75,6 +75,16 @@ class TestParseIrsDropListing:
         assert len(docs) == 1
         assert docs[0].year == 2024
 
+    def test_filter_by_years(self):
+        """Filter documents by several years in one pass."""
+        html = """
+        <a href="rp-24-40.pdf">rp-24-40.pdf</a>
+        <a href="rp-23-34.pdf">rp-23-34.pdf</a>
+        <a href="rp-22-38.pdf">rp-22-38.pdf</a>
+        """
+        docs = parse_irs_drop_listing(html, years=[2022, 2024])
+        assert [d.year for d in docs] == [2024, 2022]
+
     def test_filter_by_doc_type(self):
         """Filter documents by type."""
         html = """
@@ -96,6 +106,17 @@ class TestParseIrsDropListing:
         docs = parse_irs_drop_listing(html)
         assert len(docs) == 1  # Only the Rev. Proc.
 
+    def test_parse_links_only(self):
+        """Filenames are read from link URLs, not surrounding text."""
+        html = """
+        <a class="pdf" href='https://www.irs.gov/pub/irs-drop/rp-24-40.pdf'>Rev. Proc.</a>
+        <p>Superseded by n-24-01.pdf</p>
+        <a href=/pub/irs-drop/RR-23-12.pdf>rr-23-12.pdf</a>
+        <a href="/pub/irs-drop/rp-24-40.pdf">duplicate</a>
+        """
+        docs = parse_irs_drop_listing(html)
+        assert [d.pdf_filename for d in docs] == ["rp-24-40.pdf", "rr-23-12.pdf"]
+
 
 class TestIRSBulkFetcher:
     """Tests for the IRS bulk fetcher."""
@@ -140,23 +161,117 @@ class TestIRSBulkFetcher:
 
     def test_fetch_document_pdf(self, fetcher):
         """Fetch PDF content for a document."""
+        import httpx
+
         mock_pdf = b"%PDF-1.4 test content"
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            return httpx.Response(200, content=mock_pdf)
+
+        fetcher.client = httpx.Client(transport=httpx.MockTransport(handler))
+        doc = IRSDropDocument(
+            doc_type=GuidanceType.REV_PROC,
+            doc_number="2024-40",
+            year=2024,
+            pdf_filename="rp-24-40.pdf",
+        )
+        content = fetcher.fetch_pdf(doc)
+
+        assert content == mock_pdf
+        assert requested == [doc.pdf_url]
+
+    def test_fetch_pdf_to_streams_to_file(self, fetcher, tmp_path):
+        """PDFs can be streamed straight to disk."""
+        import httpx
+
+        mock_pdf = b"%PDF-1.4 " + b"x" * 200_000
+        fetcher.client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=mock_pdf))
+        )
+        doc = IRSDropDocument(
+            doc_type=GuidanceType.REV_PROC,
+            doc_number="2024-40",
+            year=2024,
+            pdf_filename="rp-24-40.pdf",
+        )
+
+        size = fetcher.fetch_pdf_to(doc, tmp_path / doc.pdf_filename)
+
+        assert size == len(mock_pdf)
+        assert (tmp_path / doc.pdf_filename).read_bytes() == mock_pdf
+        assert list(tmp_path.iterdir()) == [tmp_path / doc.pdf_filename]
+
+    def test_fetch_pdf_to_leaves_nothing_on_error(self, fetcher, tmp_path):
+        """A failed download doesn't leave a partial file behind."""
+        import httpx
+
+        fetcher.client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(404))
+        )
+        doc = IRSDropDocument(
+            doc_type=GuidanceType.REV_PROC,
+            doc_number="2024-40",
+            year=2024,
+            pdf_filename="rp-24-40.pdf",
+        )
 
-        with patch.object(fetcher.client, "get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.content = mock_pdf
-            mock_response.raise_for_status = MagicMock()
-            mock_get.return_value = mock_response
+        with pytest.raises(httpx.HTTPStatusError):
+            fetcher.fetch_pdf_to(doc, tmp_path / doc.pdf_filename)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_fetch_pdfs_concurrently(self, fetcher):
+        """Many PDFs are fetched concurrently, with failures reported per document."""
+        import httpx
 
-            doc = IRSDropDocument(
+        def handler(request):
+            if request.url.path.endswith("rp-24-39.pdf"):
+                return httpx.Response(404)
+            return httpx.Response(200, content=request.url.path.encode())
+
+        real_client = httpx.AsyncClient
+        docs = [
+            IRSDropDocument(
                 doc_type=GuidanceType.REV_PROC,
-                doc_number="2024-40",
+                doc_number=f"2024-{n}",
                 year=2024,
-                pdf_filename="rp-24-40.pdf",
+                pdf_filename=f"rp-24-{n}.pdf",
             )
-            content = fetcher.fetch_pdf(doc)
+            for n in (40, 39, 38)
+        ]
+
+        with patch(
+            "arch.fetchers.irs_bulk.httpx.AsyncClient",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+        ):
+            results = fetcher.fetch_pdfs(docs, concurrency=2)
+
+        assert results[0] == b"/pub/irs-drop/rp-24-40.pdf"
+        assert isinstance(results[1], httpx.HTTPStatusError)
+        assert results[2] == b"/pub/irs-drop/rp-24-38.pdf"
+
+    def test_iter_pdfs_fetches_in_batches(self, fetcher):
+        """iter_pdfs fetches a batch at a time and keeps documents in order."""
+        docs = [
+            IRSDropDocument(
+                doc_type=GuidanceType.REV_PROC,
+                doc_number=f"2024-{n}",
+                year=2024,
+                pdf_filename=f"rp-24-{n}.pdf",
+            )
+            for n in (40, 39, 38)
+        ]
 
-        assert content == mock_pdf
+        def fetch_pdfs(batch, concurrency):
+            return [doc.pdf_filename.encode() for doc in batch]
+
+        with patch.object(fetcher, "fetch_pdfs", side_effect=fetch_pdfs) as mock_fetch:
+            results = list(fetcher.iter_pdfs(docs, batch_size=2))
+
+        assert [len(call.args[0]) for call in mock_fetch.call_args_list] == [2, 1]
+        assert results == [(doc, doc.pdf_filename.encode()) for doc in docs]
 
     def test_document_url(self, fetcher):
         """Test PDF URL construction."""
@@ -168,6 +283,17 @@ class TestIRSBulkFetcher:
         )
         assert doc.pdf_url == "https://www.irs.gov/pub/irs-drop/rp-24-40.pdf"
 
+    def test_document_id_and_title(self, fetcher):
+        """Document IDs and titles use the type's prefix and name."""
+        doc = IRSDropDocument(
+            doc_type=GuidanceType.NOTICE,
+            doc_number="2024-78",
+            year=2024,
+            pdf_filename="n-24-78.pdf",
+        )
+        assert doc.id == "notice-2024-78"
+        assert fetcher._generate_title(doc) == "Notice 2024-78"
+
 
 class TestBulkDownloadWithExtraction:
     """Tests for bulk download with text extraction."""
@@ -221,6 +347,42 @@ class TestBulkDownloadWithExtraction:
         assert result.doc_type == GuidanceType.REV_PROC
         assert "Test content" in result.full_text
 
+    def test_bulk_download_streams_pdfs_without_extraction(self, fetcher, tmp_path):
+        """Without text extraction, PDFs stream to disk and failures leave no partial files."""
+        import httpx
+
+        mock_html = """
+        <a href="rp-24-40.pdf">rp-24-40.pdf</a>
+        <a href="rp-24-39.pdf">rp-24-39.pdf</a>
+        """
+        mock_pdf = b"%PDF-1.4 " + b"x" * 100_000
+
+        def broken_body():
+            yield b"%PDF-1.4 partial"
+            raise httpx.ReadError("connection reset")
+
+        def handler(request):
+            if request.url.path.endswith("rp-24-39.pdf"):
+                return httpx.Response(200, content=broken_body())
+            return httpx.Response(200, content=mock_pdf)
+
+        fetcher.client = httpx.Client(transport=httpx.MockTransport(handler))
+        with patch.object(fetcher, "_fetch_drop_listing", return_value=mock_html):
+            stats = fetcher.download_bulk_with_extraction(
+                years=[2024],
+                doc_types=[GuidanceType.REV_PROC],
+                output_dir=tmp_path,
+                extract_text=False,
+                rate_limit_seconds=0,
+            )
+
+        pdf_dir = tmp_path / "irs"
+        assert stats["downloaded"] == 1
+        assert stats["errors"] == 1
+        assert (pdf_dir / "rp-24-40.pdf").read_bytes() == mock_pdf
+        assert not (pdf_dir / "rp-24-39.pdf").exists()
+        assert not list(pdf_dir.glob("*.part"))
+
     def test_bulk_download_progress_callback(self, fetcher, tmp_path):
         """Test progress callback during bulk download."""
         mock_html = """
@@ -235,7 +397,9 @@ class TestBulkDownloadWithExtraction:
 
         with patch.object(fetcher, "_fetch_drop_listing", return_value=mock_html):
             mock_pdf = b"%PDF-1.4 test"
-            with patch.object(fetcher, "fetch_pdf", return_value=mock_pdf):
+            with patch.object(
+                fetcher, "fetch_pdfs", side_effect=lambda docs, concurrency: [mock_pdf] * len(docs)
+            ):
                 fetcher.fetch_and_store(
                     years=[2024],
                     doc_types=[GuidanceType.REV_PROC],
@@ -247,6 +411,26 @@ class TestBulkDownloadWithExtraction:
         assert len(progress_messages) > 0
         assert any("Found" in msg for msg in progress_messages)
 
+    def test_bulk_download_orders_by_requested_years(self, fetcher, tmp_path):
+        """Documents are fetched year by year in the order requested."""
+        mock_html = """
+        <a href="rp-24-40.pdf">rp-24-40.pdf</a>
+        <a href="rp-23-34.pdf">rp-23-34.pdf</a>
+        <a href="rp-24-39.pdf">rp-24-39.pdf</a>
+        """
+
+        def fetch_pdfs(docs, concurrency):
+            return [b"%PDF-1.4"] * len(docs)
+
+        with patch.object(fetcher, "_fetch_drop_listing", return_value=mock_html), \
+                patch.object(fetcher, "fetch_pdfs", side_effect=fetch_pdfs):
+            results = fetcher.fetch_and_store(
+                years=[2023, 2024],
+                doc_types=[GuidanceType.REV_PROC],
+            )
+
+        assert [r.doc_number for r in results] == ["2023-34", "2024-40", "2024-39"]
+
     def test_bulk_download_saves_pdfs(self, fetcher, tmp_path):
         """Test that PDFs are saved to the specified directory."""
         mock_html = """
@@ -255,7 +439,7 @@ class TestBulkDownloadWithExtraction:
 
         with patch.object(fetcher, "_fetch_drop_listing", return_value=mock_html):
             mock_pdf = b"%PDF-1.4 test content for saving"
-            with patch.object(fetcher, "fetch_pdf", return_value=mock_pdf):
+            with patch.object(fetcher, "fetch_pdfs", return_value=[mock_pdf]):
                 results = fetcher.fetch_and_store(
                     years=[2024],
                     doc_types=[GuidanceType.REV_PROC],
@@ -276,13 +460,8 @@ class TestBulkDownloadWithExtraction:
         <a href="rp-24-39.pdf">rp-24-39.pdf</a>
         """
 
-        call_count = [0]
-
-        def mock_fetch_pdf(doc):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                raise httpx.HTTPError("404 Not Found")
-            return b"%PDF-1.4 success"
+        def mock_fetch_pdfs(docs, concurrency):
+            return [httpx.HTTPError("404 Not Found"), b"%PDF-1.4 success"]
 
         error_messages = []
 
@@ -291,7 +470,7 @@ class TestBulkDownloadWithExtraction:
                 error_messages.append(msg)
 
         with patch.object(fetcher, "_fetch_drop_listing", return_value=mock_html):
-            with patch.object(fetcher, "fetch_pdf", side_effect=mock_fetch_pdf):
+            with patch.object(fetcher, "fetch_pdfs", side_effect=mock_fetch_pdfs):
                 results = fetcher.fetch_and_store(
                     years=[2024],
                     doc_types=[GuidanceType.REV_PROC],
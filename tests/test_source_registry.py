@@ -0,0 +1,341 @@
+"""Tests for the statute source registry."""
+
+from unittest.mock import patch
+
+import pytest
+
+SAMPLE_YAML = """\
+jurisdiction: us-zz
+name: Test State
+source_type: html
+base_url: https://example.com
+codes:
+  TAX: Tax Code
+"""
+
+
+@pytest.fixture(autouse=True)
+def scan_cache_dir(tmp_path_factory):
+    """Keep saved scans out of the user's cache directory."""
+    from arch.sources import registry
+
+    cache_dir = tmp_path_factory.mktemp("scan-cache") / "arch"
+    with patch.object(registry, "SCAN_CACHE_DIR", cache_dir):
+        yield cache_dir
+
+
+class TestLoadYamlConfigs:
+    """Tests for loading source configs from YAML files."""
+
+    def test_load_yaml_config(self, tmp_path):
+        """YAML files are parsed into SourceConfig objects by jurisdiction."""
+        from arch.sources.registry import _load_yaml_configs
+
+        (tmp_path / "us-zz.yaml").write_text(SAMPLE_YAML)
+        (tmp_path / "empty.yaml").write_text("")
+
+        configs = _load_yaml_configs(tmp_path)
+
+        assert list(configs) == ["us-zz"]
+        config = configs["us-zz"]
+        assert config.name == "Test State"
+        assert config.codes == {"TAX": "Tax Code"}
+        assert config.code_ids == ("TAX",)
+        assert config.rate_limit == 0.5
+
+    def test_unchanged_files_are_not_reparsed(self, tmp_path):
+        """Repeat loads reuse parsed configs until a file's mtime changes."""
+        import os
+
+        from arch.sources import registry
+
+        yaml_file = tmp_path / "us-zz.yaml"
+        yaml_file.write_text(SAMPLE_YAML)
+
+        with patch.object(
+            registry, "_parse_yaml_config", wraps=registry._parse_yaml_config
+        ) as mock_parse:
+            first = registry._load_yaml_configs(tmp_path)
+            second = registry._load_yaml_configs(tmp_path)
+            assert mock_parse.call_count == 1
+            assert second["us-zz"] is first["us-zz"]
+
+            # Edit one file and add another, which also bumps the directory
+            yaml_file.write_text(SAMPLE_YAML.replace("Test State", "Renamed"))
+            (tmp_path / "us-yy.yaml").write_text(SAMPLE_YAML.replace("us-zz", "us-yy"))
+            for path in (yaml_file, tmp_path):
+                stat = path.stat()
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            third = registry._load_yaml_configs(tmp_path)
+
+        assert mock_parse.call_count == 3
+        assert third["us-zz"].name == "Renamed"
+        assert third["us-yy"].name == "Test State"
+
+    def test_unchanged_directory_skips_scan(self, tmp_path):
+        """While the directory's mtime is unchanged, files aren't listed again."""
+        from arch.sources import registry
+
+        (tmp_path / "us-zz.yaml").write_text(SAMPLE_YAML)
+        first = registry._load_yaml_configs(tmp_path)
+
+        with patch.object(registry, "_scan_yaml_files") as mock_scan:
+            second = registry._load_yaml_configs(tmp_path)
+
+        mock_scan.assert_not_called()
+        assert second == first
+
+    def test_load_one_yaml_config(self, tmp_path):
+        """A single jurisdiction's file is loaded without parsing the rest."""
+        from arch.sources import registry
+
+        (tmp_path / "us-zz.yaml").write_text(SAMPLE_YAML)
+        (tmp_path / "us-yy.yaml").write_text("name: [unclosed")
+
+        assert registry._list_yaml_jurisdictions(tmp_path) == {"us-zz", "us-yy"}
+        with patch.object(
+            registry, "_parse_yaml_config", wraps=registry._parse_yaml_config
+        ) as mock_parse:
+            config = registry._load_one_yaml_config("us-zz", tmp_path)
+
+        assert config.name == "Test State"
+        assert mock_parse.call_count == 1
+        assert registry._load_one_yaml_config("us-xx", tmp_path) is None
+
+    def test_many_files_read_in_parallel(self, tmp_path):
+        """Large directories are read on a thread pool and parsed in order."""
+        import threading
+
+        from arch.sources import registry
+
+        for i in range(registry.PARALLEL_YAML_THRESHOLD + 2):
+            (tmp_path / f"us-z{i}.yaml").write_text(
+                SAMPLE_YAML.replace("us-zz", f"us-z{i}")
+            )
+
+        parse_threads = set()
+        real_parse = registry._parse_yaml_config
+
+        def parse(yaml_file, content=None):
+            assert content is not None
+            parse_threads.add(threading.current_thread())
+            return real_parse(yaml_file, content)
+
+        with patch.object(
+            registry, "ThreadPoolExecutor", wraps=registry.ThreadPoolExecutor
+        ) as mock_pool, patch.object(registry, "_parse_yaml_config", parse):
+            configs = registry._load_yaml_configs(tmp_path)
+
+        mock_pool.assert_called_once()
+        assert parse_threads == {threading.current_thread()}
+        assert len(configs) == registry.PARALLEL_YAML_THRESHOLD + 2
+        assert configs["us-z3"].jurisdiction == "us-z3"
+
+    def test_invalid_config_is_skipped(self, tmp_path, caplog):
+        """Configs that fail validation are logged with the offending field."""
+        from arch.sources.registry import _load_yaml_configs
+
+        (tmp_path / "us-zz.yaml").write_text(SAMPLE_YAML + "rate_limit: fast\n")
+        (tmp_path / "us-yy.yaml").write_text("- not\n- a mapping\n")
+        (tmp_path / "us-xx.yaml").write_text("codes:\n  1: State Government\n")
+
+        configs = _load_yaml_configs(tmp_path)
+
+        assert list(configs) == ["us-xx"]
+        assert configs["us-xx"].codes == {"1": "State Government"}
+        assert "rate_limit" in caplog.text
+        assert "us-yy.yaml" in caplog.text
+
+    def test_saved_scan_skips_yaml_in_new_process(self, tmp_path, scan_cache_dir):
+        """A fresh process reuses the saved scan until a file changes."""
+        import os
+        import stat
+
+        from arch.sources import registry
+
+        yaml_file = tmp_path / "us-zz.yaml"
+        yaml_file.write_text(SAMPLE_YAML)
+        first = registry._load_yaml_configs(tmp_path)
+
+        # Saved outside the sources directory, with umask-based permissions
+        assert not list(tmp_path.glob("*.json"))
+        (cache_file,) = scan_cache_dir.glob("*.json")
+        umask = os.umask(0)
+        os.umask(umask)
+        assert stat.S_IMODE(cache_file.stat().st_mode) == 0o666 & ~umask
+
+        # Simulate a new process: no in-memory caches
+        with patch.dict(registry._YAML_CACHE, clear=True), \
+                patch.dict(registry._DIR_CACHE, clear=True), \
+                patch.object(registry, "_parse_yaml_config") as mock_parse:
+            second = registry._load_yaml_configs(tmp_path)
+            mock_parse.assert_not_called()
+
+        assert second == first
+
+        yaml_file.write_text(SAMPLE_YAML + "rate_limit: 1.0\n")
+        with patch.dict(registry._YAML_CACHE, clear=True), \
+                patch.dict(registry._DIR_CACHE, clear=True):
+            third = registry._load_yaml_configs(tmp_path)
+
+        assert third["us-zz"].rate_limit == 1.0
+
+    def test_unwritable_scan_cache_is_skipped(self, tmp_path, scan_cache_dir):
+        """Configs still load when the scan cache can't be written."""
+        from arch.sources import registry
+
+        scan_cache_dir.write_text("not a directory")
+        (tmp_path / "us-zz.yaml").write_text(SAMPLE_YAML)
+
+        configs = registry._load_yaml_configs(tmp_path)
+
+        assert list(configs) == ["us-zz"]
+
+    def test_saved_scan_ignored_after_format_change(self, tmp_path):
+        """A scan saved under another cache format version is re-parsed."""
+        from arch.sources import registry
+
+        (tmp_path / "us-zz.yaml").write_text(SAMPLE_YAML)
+        registry._load_yaml_configs(tmp_path)
+
+        with patch.dict(registry._YAML_CACHE, clear=True), \
+                patch.dict(registry._DIR_CACHE, clear=True), \
+                patch.object(registry, "SCAN_CACHE_VERSION", registry.SCAN_CACHE_VERSION + 1), \
+                patch.object(
+                    registry, "_parse_yaml_config", wraps=registry._parse_yaml_config
+                ) as mock_parse:
+            configs = registry._load_yaml_configs(tmp_path)
+
+        mock_parse.assert_called_once()
+        assert list(configs) == ["us-zz"]
+
+
+class TestGetConfigForJurisdiction:
+    """Tests for looking up a jurisdiction's source config."""
+
+    def test_lookup_loads_only_that_yaml(self, tmp_path):
+        """Before the full registry is built, lookups read one YAML file."""
+        from arch.sources import registry
+
+        (tmp_path / "us-zz.yaml").write_text(SAMPLE_YAML)
+
+        with patch.object(registry, "_default_sources_dir", return_value=tmp_path), \
+                patch.dict(registry._SOURCE_CONFIGS, clear=True), \
+                patch.object(registry, "_get_builtin_configs") as mock_builtin:
+            config = registry.get_config_for_jurisdiction("US-ZZ")
+            assert not registry._SOURCE_CONFIGS
+
+        assert config.name == "Test State"
+        mock_builtin.assert_not_called()
+
+    def test_builtin_lookup(self, tmp_path):
+        """Jurisdictions without a YAML file fall back to built-in configs."""
+        from arch.sources import registry
+
+        with patch.object(registry, "_default_sources_dir", return_value=tmp_path), \
+                patch.dict(registry._SOURCE_CONFIGS, clear=True), \
+                patch.object(registry, "_load_yaml_configs") as mock_scan:
+            config = registry.get_config_for_jurisdiction("us-oh")
+            mock_scan.assert_not_called()
+            assert registry.get_config_for_jurisdiction("us-nowhere") is None
+
+        assert config.name == "Ohio"
+
+    def test_builtin_configs_built_once(self):
+        """Built-in configs are constructed once and are read-only."""
+        from arch.sources.registry import _get_builtin_configs
+
+        builtins = _get_builtin_configs()
+        assert _get_builtin_configs() is builtins
+        with pytest.raises(TypeError):
+            builtins["us-zz"] = builtins["us-oh"]
+
+    def test_configs_are_frozen_slotted(self):
+        """Shared configs can't be mutated and carry no per-instance dict."""
+        from dataclasses import FrozenInstanceError
+
+        from arch.sources.registry import get_config_for_jurisdiction
+
+        config = get_config_for_jurisdiction("us-oh")
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            config.name = "Renamed"
+        with pytest.raises(TypeError):
+            config.codes["9999"] = "Renamed"
+        with pytest.raises(TypeError):
+            config.codes.update({"9999": "Renamed"})
+
+    def test_configs_can_be_pickled_and_copied(self):
+        """Configs survive pickling, deep copies and asdict."""
+        import copy
+        import dataclasses
+        import pickle
+
+        from arch.sources.registry import get_config_for_jurisdiction
+
+        config = get_config_for_jurisdiction("us-oh")
+
+        restored = pickle.loads(pickle.dumps(config))
+        assert restored == config
+        with pytest.raises(TypeError):
+            restored.codes["9999"] = "Renamed"
+        assert copy.deepcopy(config) == config
+        assert dataclasses.asdict(config)["codes"] == dict(config.codes)
+
+    def test_builtin_lookup_skips_yaml_import(self):
+        """Looking up a built-in jurisdiction doesn't import PyYAML."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from arch.sources.registry import get_config_for_jurisdiction\n"
+            "assert get_config_for_jurisdiction('us-oh') is not None\n"
+            "print('yaml' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+
+class TestGetSourceForJurisdiction:
+    """Tests for adapter selection."""
+
+    def test_adapter_class_by_source_type(self):
+        """Adapters resolve by source type, falling back to HTML."""
+        from arch.sources.api import APISource
+        from arch.sources.html import HTMLSource
+        from arch.sources.registry import _adapter_class
+        from arch.sources.uslm import USLMSource
+
+        assert _adapter_class("uslm") is USLMSource
+        assert _adapter_class("api") is APISource
+        assert _adapter_class("html") is HTMLSource
+        assert _adapter_class("pdf") is HTMLSource
+
+    def test_source_for_jurisdiction(self):
+        """Configured jurisdictions get an adapter instance, others None."""
+        from arch.sources import registry
+        from arch.sources.api import NYLegislationSource
+        from arch.sources.base import SourceConfig
+        from arch.sources.html import HTMLSource
+
+        ny = SourceConfig(
+            jurisdiction="us-ny", name="New York", source_type="api", base_url=""
+        )
+        with patch.object(registry, "get_config_for_jurisdiction", return_value=ny):
+            assert isinstance(registry.get_source_for_jurisdiction("us-ny"), NYLegislationSource)
+
+        assert isinstance(registry.get_source_for_jurisdiction("us-ca"), HTMLSource)
+        assert registry.get_source_for_jurisdiction("xx-nowhere") is None
+
+    def test_list_supported_jurisdictions(self):
+        """Listings expose each config's precomputed code IDs."""
+        from arch.sources.registry import get_all_configs, list_supported_jurisdictions
+
+        listing = list_supported_jurisdictions()
+
+        assert [entry["jurisdiction"] for entry in listing] == sorted(get_all_configs())
+        for entry in listing:
+            assert entry["codes"] == tuple(get_all_configs()[entry["jurisdiction"]].codes)
@@ -129,3 +129,28 @@ class TestSQLiteStorage:
         assert retrieved.subsections[0].identifier == "a"
         assert len(retrieved.subsections[0].children) == 1
         assert retrieved.subsections[0].children[0].identifier == "1"
+
+
+class TestStoragePackage:
+    """Tests for the storage package exports."""
+
+    def test_postgres_backend_imported_on_first_use(self):
+        """Importing arch.storage does not load the PostgreSQL backend."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, arch.storage as s; "
+            "assert 'arch.storage.postgres' not in sys.modules; "
+            "from arch.storage import PostgresStorage; "
+            "assert 'arch.storage.postgres' in sys.modules; "
+            "assert s.PostgresStorage is PostgresStorage"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names still raise AttributeError."""
+        import arch.storage
+
+        with pytest.raises(AttributeError):
+            assert arch.storage.MissingStorage is None
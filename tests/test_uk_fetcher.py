@@ -33,6 +33,28 @@ SAMPLE_SECTION_RESPONSE = """<?xml version="1.0" encoding="UTF-8"?>
 </Legislation>
 """
 
+SAMPLE_WHOLE_ACT_RESPONSE = """<?xml version="1.0" encoding="UTF-8"?>
+<Legislation xmlns="http://www.legislation.gov.uk/namespaces/legislation"
+             xmlns:ukm="http://www.legislation.gov.uk/namespaces/metadata"
+             DocumentURI="http://www.legislation.gov.uk/ukpga/2003/1">
+<ukm:Metadata>
+    <ukm:EnactmentDate Date="2003-04-10"/>
+</ukm:Metadata>
+<Primary>
+    <Body>
+        <P1 id="section-1" DocumentURI="http://www.legislation.gov.uk/ukpga/2003/1/section/1">
+            <Pnumber>1</Pnumber>
+            <P1para><Text>Overview of the Act.</Text></P1para>
+        </P1>
+        <P1 id="section-2" DocumentURI="http://www.legislation.gov.uk/ukpga/2003/1/section/2">
+            <Pnumber>2</Pnumber>
+            <P1para><Text>Abbreviations.</Text></P1para>
+        </P1>
+    </Body>
+</Primary>
+</Legislation>
+"""
+
 
 class TestUKLegislationFetcher:
     """Tests for UK legislation fetcher."""
@@ -71,6 +93,16 @@ class TestUKLegislationFetcher:
         url = fetcher.build_url(citation)
         assert url == "https://www.legislation.gov.uk/ukpga/2003/1/data.xml"
 
+    def test_build_versioned_url(self):
+        """Build URL for a point-in-time version of a section."""
+        from arch.fetchers.legislation_uk import UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        fetcher = UKLegislationFetcher()
+        citation = UKCitation(type="ukpga", year=2003, number=1, section="62")
+        url = fetcher.build_url(citation, version="enacted")
+        assert url == "https://www.legislation.gov.uk/ukpga/2003/1/section/62/enacted/data.xml"
+
 
 class TestUKLegislationDownload:
     """Tests for downloading UK legislation."""
@@ -78,13 +110,13 @@ class TestUKLegislationDownload:
     @pytest.mark.asyncio
     async def test_fetch_section(self, tmp_path):
         """Fetch a single section."""
-        from arch.fetchers.legislation_uk import UKLegislationFetcher
+        from arch.fetchers.legislation_uk import FetchResult, UKLegislationFetcher
         from arch.models_uk import UKCitation
 
         fetcher = UKLegislationFetcher(data_dir=tmp_path)
 
         with patch.object(fetcher, '_fetch_xml', new_callable=AsyncMock) as mock_fetch:
-            mock_fetch.return_value = SAMPLE_SECTION_RESPONSE
+            mock_fetch.return_value = FetchResult(200, SAMPLE_SECTION_RESPONSE.encode())
 
             citation = UKCitation(type="ukpga", year=2003, number=1, section="62")
             section = await fetcher.fetch_section(citation)
@@ -96,20 +128,598 @@ class TestUKLegislationDownload:
     @pytest.mark.asyncio
     async def test_fetch_with_caching(self, tmp_path):
         """Fetched XML is cached to disk."""
-        from arch.fetchers.legislation_uk import UKLegislationFetcher
+        import os
+        import stat
+
+        from arch.fetchers.legislation_uk import FetchResult, UKLegislationFetcher
         from arch.models_uk import UKCitation
 
         fetcher = UKLegislationFetcher(data_dir=tmp_path)
 
         with patch.object(fetcher, '_fetch_xml', new_callable=AsyncMock) as mock_fetch:
-            mock_fetch.return_value = SAMPLE_SECTION_RESPONSE
+            mock_fetch.return_value = FetchResult(200, SAMPLE_SECTION_RESPONSE.encode())
 
             citation = UKCitation(type="ukpga", year=2003, number=1, section="62")
             await fetcher.fetch_section(citation, cache=True)
 
-            # Check cache file exists
+            # Check cache file exists, with no temp files left behind
             cache_path = tmp_path / "ukpga" / "2003" / "1" / "section-62.xml"
             assert cache_path.exists()
+            assert not list(cache_path.parent.glob("*.tmp"))
+
+            # Permissions follow the umask, like a plain write would
+            umask = os.umask(0)
+            os.umask(umask)
+            assert stat.S_IMODE(cache_path.stat().st_mode) == 0o666 & ~umask
+
+            # Second fetch is served from the cache
+            await fetcher.fetch_section(citation)
+            assert mock_fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_act_sections_skips_missing(self, tmp_path):
+        """Sections that 404 are skipped when fetching a whole Act."""
+        from arch.fetchers.legislation_uk import FetchResult, UKLegislationFetcher
+        from arch.models_uk import UKAct, UKCitation
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path, max_concurrency=2)
+        citation = UKCitation(type="ukpga", year=2003, number=1)
+        act = UKAct(
+            citation=citation,
+            title="Income Tax (Earnings and Pensions) Act 2003",
+            enacted_date=date(2003, 4, 10),
+            section_count=3,
+        )
+
+        async def fake_fetch(url, entry=None, missing_ok=False):
+            if "/contents/" in url or "/section/2/" in url:
+                assert missing_ok
+                return FetchResult(404, b"")
+            return FetchResult(200, SAMPLE_SECTION_RESPONSE.encode())
+
+        with patch.object(fetcher, "fetch_act_metadata", new_callable=AsyncMock) as mock_meta, \
+                patch.object(fetcher, "_fetch_xml", side_effect=fake_fetch):
+            mock_meta.return_value = act
+            sections = [s async for s in fetcher.fetch_act_sections(citation, max_sections=10)]
+
+        assert len(sections) == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_act_sections_uses_contents(self, tmp_path):
+        """Only sections listed in the table of contents are fetched."""
+        from arch.fetchers.legislation_uk import FetchResult, UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path)
+        citation = UKCitation(type="ukpga", year=2003, number=1)
+        fetched_urls = []
+
+        async def fake_fetch(url, entry=None, missing_ok=False):
+            fetched_urls.append(url)
+            return FetchResult(200, SAMPLE_SECTION_RESPONSE.encode())
+
+        with patch.object(fetcher, "fetch_contents", new_callable=AsyncMock) as mock_contents, \
+                patch.object(fetcher, "_fetch_xml", side_effect=fake_fetch):
+            mock_contents.return_value = ["1", "4A"]
+            sections = [s async for s in fetcher.fetch_act_sections(citation, max_sections=10)]
+
+        assert len(sections) == 2
+        assert sorted(fetched_urls) == [
+            "https://www.legislation.gov.uk/ukpga/2003/1/section/1/data.xml",
+            "https://www.legislation.gov.uk/ukpga/2003/1/section/4A/data.xml",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_fetch_act_sections_creates_cache_dir_once(self, tmp_path):
+        """The Act's cache directory is created once, not per section."""
+        from arch.fetchers.legislation_uk import FetchResult, UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path)
+        citation = UKCitation(type="ukpga", year=2003, number=1)
+        real_mkdir = Path.mkdir
+        created = []
+
+        def counting_mkdir(path, *args, **kwargs):
+            if kwargs.get("parents"):
+                created.append(path)
+            return real_mkdir(path, *args, **kwargs)
+
+        with patch.object(fetcher, "fetch_contents", new_callable=AsyncMock) as mock_contents, \
+                patch.object(fetcher, "_fetch_xml", new_callable=AsyncMock) as mock_fetch, \
+                patch.object(Path, "mkdir", counting_mkdir):
+            mock_contents.return_value = ["1", "2", "3"]
+            mock_fetch.return_value = FetchResult(200, SAMPLE_SECTION_RESPONSE.encode())
+            sections = [s async for s in fetcher.fetch_act_sections(citation, max_sections=10)]
+
+        assert len(sections) == 3
+        act_dir = tmp_path / "ukpga" / "2003" / "1"
+        assert created.count(act_dir) == 1
+        assert len(list(act_dir.glob("section-*.xml"))) == 3
+
+    @pytest.mark.asyncio
+    async def test_documents_parsed_off_event_loop(self, tmp_path):
+        """Parsing runs in a worker thread, not on the event loop thread."""
+        import threading
+
+        from arch.fetchers.legislation_uk import UKLegislationFetcher
+        from arch.parsers.clml import parse_section
+
+        threads = []
+
+        def recording_parse(xml_bytes):
+            threads.append(threading.get_ident())
+            return parse_section(xml_bytes)
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path)
+        section = await fetcher._parse(recording_parse, SAMPLE_SECTION_RESPONSE.encode())
+
+        assert "salary" in section.text
+        assert threads and threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_fetch_act_sections_whole_act(self, tmp_path):
+        """Unbounded fetches download the whole Act in one request."""
+        from arch.fetchers.legislation_uk import FetchResult, UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path)
+        citation = UKCitation(type="ukpga", year=2003, number=1)
+
+        with patch.object(fetcher, '_fetch_xml', new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = FetchResult(200, SAMPLE_WHOLE_ACT_RESPONSE.encode())
+            sections = [s async for s in fetcher.fetch_act_sections(citation)]
+
+            assert [s.citation.section for s in sections] == ["1", "2"]
+            assert mock_fetch.await_count == 1
+
+            # Sections from the whole-Act parse are served from memory
+            section = await fetcher.fetch_section(citation.model_copy(update={"section": "2"}))
+            assert section is sections[1]
+            assert mock_fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_client_reused_and_closed(self, tmp_path):
+        """A single HTTP client is shared across requests and closed on exit."""
+        from arch.fetchers.legislation_uk import UKLegislationFetcher
+
+        async with UKLegislationFetcher(data_dir=tmp_path) as fetcher:
+            client = fetcher._get_client()
+            assert fetcher._get_client() is client
+
+        assert client.is_closed
+        assert fetcher._client is None
+
+    @pytest.mark.asyncio
+    async def test_client_uses_http2(self, tmp_path):
+        """The shared client negotiates HTTP/2 over a small connection pool."""
+        from arch.fetchers import legislation_uk
+        from arch.fetchers.legislation_uk import UKLegislationFetcher
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path)
+        with patch.object(legislation_uk.httpx, "AsyncClient") as mock_client:
+            fetcher._get_client()
+
+        kwargs = mock_client.call_args.kwargs
+        assert kwargs["http2"] is True
+        assert kwargs["limits"].max_connections == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicate_fetches_coalesce(self, tmp_path):
+        """Concurrent requests for one section share a single fetch."""
+        import asyncio
+
+        from arch.fetchers.legislation_uk import FetchResult, UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path)
+
+        with patch.object(fetcher, '_fetch_xml', new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = FetchResult(200, SAMPLE_SECTION_RESPONSE.encode())
+
+            citation = UKCitation(type="ukpga", year=2003, number=1, section="62")
+            first, second = await asyncio.gather(
+                fetcher.fetch_section(citation, cache=False),
+                fetcher.fetch_section(citation, cache=False),
+            )
+
+        assert first is second
+        assert mock_fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_act_documents_coalesce(self, tmp_path):
+        """Metadata and whole-Act requests in flight together share one download."""
+        import asyncio
+
+        from arch.fetchers.legislation_uk import FetchResult, UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path)
+        citation = UKCitation(type="ukpga", year=2003, number=1)
+
+        with patch.object(fetcher, '_fetch_xml', new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = FetchResult(200, SAMPLE_WHOLE_ACT_RESPONSE.encode())
+            act, sections = await asyncio.gather(
+                fetcher.fetch_act_metadata(citation, cache=False),
+                fetcher.fetch_act_whole(citation, cache=False),
+            )
+
+        assert act.citation.number == 1
+        assert len(sections) == 2
+        assert mock_fetch.await_count == 1
+        assert fetcher._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_act_xml_reuses_metadata_download(self, tmp_path):
+        """The raw Act XML comes from the cache filled by fetching its metadata."""
+        from arch.fetchers.legislation_uk import FetchResult, UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path)
+        citation = UKCitation(type="ukpga", year=2003, number=1)
+
+        with patch.object(fetcher, '_fetch_xml', new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = FetchResult(200, SAMPLE_WHOLE_ACT_RESPONSE.encode())
+            await fetcher.fetch_act_metadata(citation)
+            xml_bytes = await fetcher.fetch_act_xml(citation)
+
+        assert xml_bytes == SAMPLE_WHOLE_ACT_RESPONSE.encode()
+        assert mock_fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_download_survives_cancelled_caller(self, tmp_path):
+        """Cancelling the caller that started a shared download spares other waiters."""
+        import asyncio
+
+        from arch.fetchers.legislation_uk import FetchResult, UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path)
+        citation = UKCitation(type="ukpga", year=2003, number=1)
+        release = asyncio.Event()
+
+        async def slow_fetch(url, entry=None, missing_ok=False):
+            await release.wait()
+            return FetchResult(200, SAMPLE_WHOLE_ACT_RESPONSE.encode())
+
+        with patch.object(fetcher, "_fetch_xml", side_effect=slow_fetch) as mock_fetch:
+            leader = asyncio.create_task(fetcher.fetch_act_metadata(citation, cache=False))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(fetcher.fetch_act_whole(citation, cache=False))
+            await asyncio.sleep(0)
+
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            # A later caller still joins the running download
+            late = asyncio.create_task(fetcher.fetch_act_metadata(citation, cache=False))
+            await asyncio.sleep(0)
+            release.set()
+            sections = await waiter
+            act = await late
+
+        assert len(sections) == 2
+        assert act.citation.number == 1
+        assert mock_fetch.await_count == 1
+        assert fetcher._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_abandoned_download_is_cancelled(self, tmp_path):
+        """A shared download is cancelled once every caller has given up."""
+        import asyncio
+
+        from arch.fetchers.legislation_uk import UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path)
+        citation = UKCitation(type="ukpga", year=2003, number=1)
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def hanging_fetch(url, entry=None, missing_ok=False):
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with patch.object(fetcher, "_fetch_xml", side_effect=hanging_fetch):
+            caller = asyncio.create_task(fetcher.fetch_act_metadata(citation, cache=False))
+            await started.wait()
+            caller.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await caller
+            await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+        await asyncio.sleep(0)
+        assert fetcher._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_forced_fetch_does_not_join_cached_load(self, tmp_path):
+        """A forced fetch starts its own download rather than joining a normal one."""
+        import asyncio
+
+        from arch.fetchers.legislation_uk import FetchResult, UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path)
+        citation = UKCitation(type="ukpga", year=2003, number=1)
+
+        with patch.object(fetcher, "_fetch_xml", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = FetchResult(200, SAMPLE_WHOLE_ACT_RESPONSE.encode())
+            await asyncio.gather(
+                fetcher.fetch_act_metadata(citation, cache=False),
+                fetcher.fetch_act_metadata(citation, cache=False, force=True),
+            )
+
+        assert mock_fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_section_fetch_survives_cancelled_caller(self, tmp_path):
+        """Cancelling the first caller for a section spares concurrent callers."""
+        import asyncio
+
+        from arch.fetchers.legislation_uk import FetchResult, UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path)
+        citation = UKCitation(type="ukpga", year=2003, number=1, section="62")
+        release = asyncio.Event()
+
+        async def slow_fetch(url, entry=None, missing_ok=False):
+            await release.wait()
+            return FetchResult(200, SAMPLE_SECTION_RESPONSE.encode())
+
+        with patch.object(fetcher, "_fetch_xml", side_effect=slow_fetch) as mock_fetch:
+            leader = asyncio.create_task(fetcher.fetch_section(citation, cache=False))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(fetcher.fetch_section(citation, cache=False))
+            await asyncio.sleep(0)
+
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            assert not any(shared.task.cancelled() for shared in fetcher._sections.values())
+            release.set()
+            section = await waiter
+
+        assert "salary" in section.text
+        assert mock_fetch.await_count == 1
+        assert await fetcher.fetch_section(citation) is section
+
+    @pytest.mark.asyncio
+    async def test_stopping_act_iteration_cancels_downloads(self, tmp_path):
+        """Breaking out of fetch_act_sections cancels section downloads still running."""
+        import asyncio
+
+        from arch.fetchers.legislation_uk import FetchResult, UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path)
+        citation = UKCitation(type="ukpga", year=2003, number=1)
+        cancelled = []
+
+        async def fake_fetch(url, entry=None, missing_ok=False):
+            if "/section/1/" in url:
+                return FetchResult(200, SAMPLE_SECTION_RESPONSE.encode())
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(url)
+                raise
+
+        with patch.object(fetcher, "fetch_contents", new_callable=AsyncMock) as mock_contents, \
+                patch.object(fetcher, "_fetch_xml", side_effect=fake_fetch):
+            mock_contents.return_value = ["1", "2", "3"]
+            sections = fetcher.fetch_act_sections(citation, max_sections=10)
+            async for _ in sections:
+                break
+            await sections.aclose()
+            await asyncio.sleep(0)
+
+        assert len(cancelled) == 2
+        assert fetcher._inflight == {}
+        assert [key[3] for key in fetcher._sections] == ["1"]
+
+    @pytest.mark.asyncio
+    async def test_section_memory_cache_is_bounded(self, tmp_path):
+        """The in-memory section cache evicts least recently used entries."""
+        from arch.fetchers.legislation_uk import FetchResult, UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path, section_cache_size=2)
+
+        with patch.object(fetcher, '_fetch_xml', new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = FetchResult(200, SAMPLE_SECTION_RESPONSE.encode())
+            for section in ("1", "2", "3"):
+                citation = UKCitation(type="ukpga", year=2003, number=1, section=section)
+                await fetcher.fetch_section(citation, cache=False)
+
+        assert [key[3] for key in fetcher._sections] == ["2", "3"]
+
+    @pytest.mark.asyncio
+    async def test_whole_act_respects_disabled_section_cache(self, tmp_path):
+        """A section cache size of 0 keeps no sections from a whole-Act parse."""
+        from arch.fetchers.legislation_uk import FetchResult, UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path, section_cache_size=0)
+        citation = UKCitation(type="ukpga", year=2003, number=1)
+
+        with patch.object(fetcher, '_fetch_xml', new_callable=AsyncMock) as mock_fetch, \
+                patch.object(fetcher, "_remember_section") as mock_remember:
+            mock_fetch.return_value = FetchResult(200, SAMPLE_WHOLE_ACT_RESPONSE.encode())
+            sections = await fetcher.fetch_act_whole(citation, cache=False)
+
+        assert len(sections) == 2
+        mock_remember.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_section(self, tmp_path):
+        """A 404 returns None with missing_ok and raises otherwise."""
+        import httpx
+
+        from arch.fetchers.legislation_uk import UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path, rate_limit_delay=0)
+        fetcher._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(404))
+        )
+        citation = UKCitation(type="ukpga", year=2003, number=1, section="999")
+
+        async with fetcher:
+            assert await fetcher.fetch_section(citation, missing_ok=True) is None
+            with pytest.raises(httpx.HTTPStatusError):
+                await fetcher.fetch_section(citation)
+
+    @pytest.mark.asyncio
+    async def test_missing_section_shared_by_strict_and_lenient_callers(self, tmp_path):
+        """Callers sharing a fetch of a missing section each get their own behaviour."""
+        import asyncio
+
+        import httpx
+
+        from arch.fetchers.legislation_uk import FetchResult, UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path)
+        citation = UKCitation(type="ukpga", year=2003, number=1, section="999")
+
+        with patch.object(fetcher, "_fetch_xml", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = FetchResult(404, b"")
+            lenient, strict = await asyncio.gather(
+                fetcher.fetch_section(citation, missing_ok=True),
+                fetcher.fetch_section(citation),
+                return_exceptions=True,
+            )
+
+        assert lenient is None
+        assert isinstance(strict, httpx.HTTPStatusError)
+        assert strict.response.status_code == 404
+        assert mock_fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_revalidate_uses_etag(self, tmp_path):
+        """Revalidation sends the stored ETag and keeps the cache on 304."""
+        import httpx
+
+        from arch.fetchers.legislation_uk import UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200, content=SAMPLE_SECTION_RESPONSE.encode(), headers={"ETag": '"v1"'}
+            )
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path, rate_limit_delay=0)
+        fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        citation = UKCitation(type="ukpga", year=2003, number=1, section="62")
+
+        async with fetcher:
+            await fetcher.fetch_section(citation)
+            section = await fetcher.fetch_section(citation, revalidate=True)
+
+        assert seen_headers == [None, '"v1"']
+        assert "salary" in section.text
+        assert (tmp_path / "ukpga" / "2003" / "1" / "section-62.etag").exists()
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_retried(self, tmp_path):
+        """429/5xx responses are retried with backoff honouring Retry-After."""
+        import httpx
+
+        from arch.fetchers.legislation_uk import UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        responses = [
+            httpx.Response(503),
+            httpx.Response(429, headers={"Retry-After": "5"}),
+            httpx.Response(200, content=SAMPLE_SECTION_RESPONSE.encode()),
+        ]
+
+        def handler(request):
+            return responses.pop(0)
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path, rate_limit_delay=0)
+        fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        citation = UKCitation(type="ukpga", year=2003, number=1, section="62")
+
+        with patch("arch.fetchers.legislation_uk.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            async with fetcher:
+                section = await fetcher.fetch_section(citation, cache=False)
+
+        assert "salary" in section.text
+        delays = [call.args[0] for call in mock_sleep.await_args_list]
+        assert len(delays) == 2
+        assert 1 <= delays[0] < 2
+        assert delays[1] >= 5
+
+    @pytest.mark.asyncio
+    async def test_persistent_errors_raise_after_retries(self, tmp_path):
+        """Retries are bounded; the final error is raised."""
+        import httpx
+
+        from arch.fetchers.legislation_uk import MAX_ATTEMPTS, UKLegislationFetcher
+        from arch.models_uk import UKCitation
+
+        attempts = []
+
+        def handler(request):
+            attempts.append(request.url)
+            return httpx.Response(502)
+
+        fetcher = UKLegislationFetcher(data_dir=tmp_path, rate_limit_delay=0)
+        fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        citation = UKCitation(type="ukpga", year=2003, number=1, section="62")
+
+        with patch("arch.fetchers.legislation_uk.asyncio.sleep", new_callable=AsyncMock):
+            async with fetcher:
+                with pytest.raises(httpx.HTTPStatusError):
+                    await fetcher.fetch_section(citation, cache=False)
+
+        assert len(attempts) == MAX_ATTEMPTS
+
+    def test_foreign_client_errors_become_httpx_errors(self):
+        """Errors from an httpx-compatible client are raised as httpx exceptions."""
+        import httpx
+
+        from arch.fetchers.legislation_uk import _as_httpx_error, _raise_for_status
+
+        # Stand-ins for an httpxr exception and one httpx has no match for
+        connect_timeout = type("ConnectTimeout", (Exception,), {})
+        unknown_error = type("UnknownError", (Exception,), {})
+
+        assert type(_as_httpx_error(connect_timeout("slow"))) is httpx.ConnectTimeout
+        assert type(_as_httpx_error(unknown_error("odd"))) is httpx.TransportError
+
+        class Response:
+            status_code = 503
+            headers = {"Retry-After": "5"}
+
+        with pytest.raises(httpx.HTTPStatusError) as excinfo:
+            _raise_for_status(Response(), "https://example.com/data.xml")
+        assert excinfo.value.response.status_code == 503
+        assert excinfo.value.response.headers["Retry-After"] == "5"
+
+
+class TestRunUK:
+    """Tests for the UK fetcher entry-point runner."""
+
+    def test_run_uk_returns_result(self):
+        """run_uk drives a coroutine to completion on either event loop."""
+        from arch.fetchers.legislation_uk import run_uk
+
+        async def answer():
+            return 42
+
+        assert run_uk(answer()) == 42
 
 
 class TestUKLegislationSearch:
@@ -137,6 +747,14 @@ class TestPriorityActs:
         assert any("2003/1" in act for act in UK_PRIORITY_ACTS)  # ITEPA
         assert any("2007/3" in act for act in UK_PRIORITY_ACTS)  # ITA
 
+    def test_priority_citations_match_acts(self):
+        """Precomputed citations line up with the priority act strings."""
+        from arch.fetchers.legislation_uk import UK_PRIORITY_ACTS, UK_PRIORITY_CITATIONS
+
+        assert len(UK_PRIORITY_CITATIONS) == len(UK_PRIORITY_ACTS)
+        first = UK_PRIORITY_CITATIONS[0]
+        assert (first.type, first.year, first.number) == ("ukpga", 2003, 1)
+
 
 class TestRateLimiting:
     """Tests for rate limiting compliance."""
@@ -148,3 +766,19 @@ class TestRateLimiting:
         # Default should be reasonable (legislation.gov.uk allows 3000/5min = 10/sec)
         fetcher = UKLegislationFetcher()
         assert fetcher.rate_limit_delay >= 0.1  # At least 100ms between requests
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_spaces_requests(self):
+        """Token bucket holds concurrent callers to the configured rate."""
+        import asyncio
+        import time
+
+        from arch.fetchers.legislation_uk import TokenBucket
+
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+        elapsed = time.monotonic() - start
+
+        # First token is immediate, the remaining four refill at 50/sec
+        assert elapsed >= 0.07